@@ -44,31 +44,58 @@ function handleLogout() {
 }
 
 // ── Fetch batches ─────────────────────────────────────────────────────────────
+const PAGE_SIZE = 100;
+let loadedCount = 0;
+
+async function fetchBatchPage(skip) {
+  const res  = await fetch(`${API_BASE}/api/batches?skip=${skip}&limit=${PAGE_SIZE}`, { headers: authHeaders() });
+  const data = await res.json();
+  if (!res.ok) throw new Error(data.detail || "Failed to load batches.");
+  return data;
+}
+
 async function loadBatches() {
   try {
-    const res  = await fetch(`${API_BASE}/api/batches`, { headers: authHeaders() });
-    const data = await res.json();
-    if (!res.ok) throw new Error(data.detail || "Failed to load batches.");
-    renderBatches(data);
+    const data = await fetchBatchPage(0);
+    loadedCount = 0;
+    renderBatches(data, true);
   } catch (err) {
     document.getElementById("loadingState").innerHTML =
       `<p style="color:#e55">Failed to load batches. Is the server running?</p>`;
   }
 }
 
+async function loadMoreBatches() {
+  const btn = document.getElementById("loadMoreBtn");
+  btn.disabled = true;
+  try {
+    renderBatches(await fetchBatchPage(loadedCount), false);
+  } catch (err) {
+    showToast(err.message, "error");
+  } finally {
+    btn.disabled = false;
+  }
+}
+
 // ── Render batch cards ────────────────────────────────────────────────────────
-function renderBatches(batches) {
+function renderBatches(page, reset) {
   const grid    = document.getElementById("batchGrid");
   const empty   = document.getElementById("emptyState");
   const loading = document.getElementById("loadingState");
+  const batches = page.items;
 
   loading.classList.add("hidden");
 
-  document.getElementById("kpiTotal").textContent    = batches.length;
-  document.getElementById("kpiIntake").textContent   = batches.reduce((s, b) => s + (b.intake_size || 0), 0);
-  document.getElementById("kpiPrograms").textContent = new Set(batches.map(b => b.program)).size;
+  // KPIs come from the server so they cover every batch, not just loaded pages.
+  document.getElementById("kpiTotal").textContent    = page.total;
+  document.getElementById("kpiIntake").textContent   = page.total_intake;
+  document.getElementById("kpiPrograms").textContent = page.program_count;
 
-  if (batches.length === 0) {
+  if (reset) grid.querySelectorAll(".batch-card").forEach(c => c.remove());
+  loadedCount += batches.length;
+  document.getElementById("loadMore").classList.toggle("hidden", loadedCount >= page.total);
+
+  if (loadedCount === 0) {
     grid.classList.add("hidden");
     empty.classList.remove("hidden");
     return;
@@ -76,11 +103,9 @@ function renderBatches(batches) {
 
   empty.classList.add("hidden");
   grid.classList.remove("hidden");
-  grid.querySelectorAll(".batch-card").forEach(c => c.remove());
 
   batches.forEach((batch, i) => {
-    const hasCustomRules = batch.rules_config &&
-      JSON.stringify(batch.rules_config) !== JSON.stringify(DEFAULT_RULES_CONFIG);
+    const hasCustomRules = batch.has_custom_rules;
 
     const card = document.createElement("div");
     card.className = "batch-card";
@@ -104,6 +129,10 @@ function renderBatches(batches) {
           <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M17 21v-2a4 4 0 0 0-4-4H5a4 4 0 0 0-4 4v2"/><circle cx="9" cy="7" r="4"/><path d="M23 21v-2a4 4 0 0 0-3-3.87"/><path d="M16 3.13a4 4 0 0 1 0 7.75"/></svg>
           Intake: ${batch.intake_size}
         </div>
+        <div class="batch-meta-row">
+          <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M16 21v-2a4 4 0 0 0-4-4H6a4 4 0 0 0-4 4v2"/><circle cx="9" cy="7" r="4"/></svg>
+          Candidates: ${batch.candidate_count}${batch.flagged_count ? ` · ${batch.flagged_count} flagged` : ""}
+        </div>
       </div>
       <div class="batch-card-footer">
         <button class="btn-view" onclick="viewBatch('${batch.id}')">View Batch →</button>
@@ -1,13 +1,20 @@
 """
 app/api/routes/admin.py
 Admin-only endpoints.
-- POST /api/admin/users  — create a new user with a specific role (admin only)
+- POST /api/admin/users                       — create a new user with a specific role
+- POST /api/admin/archive/batches/{batch_id}  — archive a deleted batch in the background
+- POST /api/admin/retention/run               — run an archival/retention sweep now
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, EmailStr, Field
 
 from app.core.security import decode_access_token, hash_password
+from app.models.audit_log import record_event
+from app.models.batch import get_batch_by_id
+from app.models.retention import archive_batch, archive_in_progress, resolve_destination, run_retention_pass
 from app.models.user import create_user
 from app.schemas.auth_schemas import UserOut
 
@@ -51,4 +58,42 @@ def create_new_user(body: CreateUserRequest, admin: dict = Depends(require_admin
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
 
-    return UserOut(id=user["id"], name=user["name"], email=user["email"], role=user["role"])
\ No newline at end of file
+    return UserOut(id=user["id"], name=user["name"], email=user["email"], role=user["role"])
+
+
+def _archive_and_record(batch_id: str, destination: Optional[str], actor: str) -> None:
+    moved = archive_batch(batch_id, destination)
+    if get_batch_by_id(batch_id, include_deleted=True):
+        return   # claimed elsewhere or interrupted by shutdown – not archived yet
+    record_event("batch.archive", "batch", batch_id, batch_id, actor=actor,
+                 before={"archived": False}, after={"archived": True, "candidates": moved})
+
+
+@router.post("/archive/batches/{batch_id}", status_code=202)
+def archive(
+    batch_id: str,
+    background: BackgroundTasks,
+    destination: Optional[str] = Query(None, pattern="^(collection|file)$"),
+    admin: dict = Depends(require_admin),
+):
+    """Move a deleted batch and its candidates to the archive (collection or gzipped NDJSON)."""
+    batch = get_batch_by_id(batch_id, include_deleted=True)
+    if not batch:
+        raise HTTPException(status_code=404, detail="Batch not found.")
+    if not batch.get("deleted_at"):
+        raise HTTPException(status_code=409, detail="Only deleted (closed) batches can be archived.")
+    if archive_in_progress(batch):
+        raise HTTPException(status_code=409, detail="Batch is already being archived.")
+    try:
+        destination = resolve_destination(destination)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    background.add_task(_archive_and_record, batch_id, destination, admin.get("email", admin.get("sub")))
+    return {"status": "scheduled", "batch_id": batch_id}
+
+
+@router.post("/retention/run", status_code=202)
+def run_retention(background: BackgroundTasks, admin: dict = Depends(require_admin)):
+    """Archive due batches, purge expired PII and prune old archive files now."""
+    background.add_task(run_retention_pass)
+    return {"status": "scheduled"}
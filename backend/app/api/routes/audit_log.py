@@ -0,0 +1,52 @@
+"""
+app/api/routes/audit_log.py
+Read-only audit trail endpoints (admin or manager only).
+- GET /api/audit/batches/{batch_id}         — all events for a batch
+- GET /api/audit/candidates/{candidate_id}  — all events for one candidate
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.core.security import decode_access_token
+from app.models.audit_log import get_audit_events
+from app.schemas.audit_schemas import AuditEventOut, AuditPage
+
+router = APIRouter(prefix="/audit", tags=["Audit"])
+bearer = HTTPBearer()
+
+
+def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(bearer)) -> dict:
+    payload = decode_access_token(credentials.credentials)
+    if not payload:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token.")
+    return payload
+
+
+def require_reviewer(user: dict = Depends(get_current_user)) -> dict:
+    if user.get("role") not in ("admin", "manager"):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only admin or manager can view the audit log.")
+    return user
+
+
+@router.get("/batches/{batch_id}", response_model=AuditPage)
+def batch_events(
+    batch_id: str,
+    skip:  int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    user: dict = Depends(require_reviewer),
+):
+    """Newest-first audit events for a batch and every candidate in it."""
+    items, total = get_audit_events(skip, limit, batch_id=batch_id)
+    return AuditPage(items=[AuditEventOut(**e) for e in items], total=total, skip=skip, limit=limit)
+
+
+@router.get("/candidates/{candidate_id}", response_model=AuditPage)
+def candidate_events(
+    candidate_id: str,
+    skip:  int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    user: dict = Depends(require_reviewer),
+):
+    """Newest-first audit events for a single candidate."""
+    items, total = get_audit_events(skip, limit, entity_id=candidate_id)
+    return AuditPage(items=[AuditEventOut(**e) for e in items], total=total, skip=skip, limit=limit)
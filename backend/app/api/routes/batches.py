@@ -2,14 +2,17 @@
 app/api/routes/batches.py
 Batch management endpoints.
 """
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.core.security import decode_access_token
-from app.models.batch import create_batch, get_all_batches, get_batch_by_id
-from app.schemas.batch_schemas import BatchCreate, BatchOut
+from app.models.audit_log import record_event
+from app.models.batch import create_batch, get_batch_by_id, list_batch_summaries, soft_delete_batch
+from app.models.candidate import get_waitlist, soft_delete_batch_candidates
+from app.schemas.batch_schemas import BatchCreate, BatchOut, BatchPage, BatchSummaryOut
+from app.schemas.candidate_schemas import CandidateOut
 
 router = APIRouter(prefix="/batches", tags=["Batches"])
 bearer = HTTPBearer()
@@ -33,14 +36,33 @@ def create(body: BatchCreate, user: dict = Depends(get_current_user)):
         created_by=user["sub"],
         rules_config=body.rules_config,  # None → default applied in model
     )
+    record_event("batch.create", "batch", batch["id"], batch["id"],
+                 actor=user.get("email", user.get("sub")), after=batch)
     return BatchOut(**batch)
 
 
-@router.get("", response_model=List[BatchOut])
-def list_batches(user: dict = Depends(get_current_user)):
-    """Get all batches (shared workspace access)."""
-    batches = get_all_batches()
-    return [BatchOut(**b) for b in batches]
+@router.get("", response_model=BatchPage)
+def list_batches(
+    skip:          int           = Query(0, ge=0),
+    limit:         int           = Query(20, ge=1, le=100),
+    created_by:    Optional[str] = None,
+    program:       Optional[str] = None,
+    include_rules: bool          = False,
+    user: dict = Depends(get_current_user),
+):
+    """
+    Page through batches newest-first (shared workspace access).
+    Pass created_by=me for the caller's own batches.
+    """
+    if created_by == "me":
+        created_by = user["sub"]
+    items, totals = list_batch_summaries(
+        skip, limit,
+        created_by=created_by,
+        program=program,
+        include_rules=include_rules,
+    )
+    return BatchPage(items=[BatchSummaryOut(**b) for b in items], **totals, skip=skip, limit=limit)
 
 
 @router.get("/{batch_id}", response_model=BatchOut)
@@ -49,4 +71,33 @@ def get_batch(batch_id: str, user: dict = Depends(get_current_user)):
     batch = get_batch_by_id(batch_id)
     if not batch:
         raise HTTPException(status_code=404, detail="Batch not found.")
-    return BatchOut(**batch)
\ No newline at end of file
+    return BatchOut(**batch)
+
+
+@router.delete("/{batch_id}", status_code=204)
+def delete_batch(batch_id: str, user: dict = Depends(get_current_user)):
+    """
+    Admin or Manager only: close a batch. The batch and its candidates are
+    soft-deleted (hidden everywhere) and archived after ARCHIVE_AFTER_DAYS.
+    """
+    if user.get("role") not in ("admin", "manager"):
+        raise HTTPException(status_code=403, detail="Only admin or manager can delete batches.")
+    if not get_batch_by_id(batch_id) or not soft_delete_batch(batch_id):
+        raise HTTPException(status_code=404, detail="Batch not found.")
+    soft_delete_batch_candidates(batch_id)
+    record_event("batch.delete", "batch", batch_id, batch_id,
+                 actor=user.get("email", user.get("sub")),
+                 before={"deleted": False}, after={"deleted": True})
+
+
+@router.get("/{batch_id}/waitlist", response_model=List[CandidateOut])
+def waitlist(
+    batch_id: str,
+    skip:  int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    user: dict = Depends(get_current_user),
+):
+    """Waitlisted candidates in promotion order (best screening score first)."""
+    if not get_batch_by_id(batch_id):
+        raise HTTPException(status_code=404, detail="Batch not found.")
+    return [CandidateOut(**c) for c in get_waitlist(batch_id, skip, limit)]
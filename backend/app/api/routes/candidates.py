@@ -8,10 +8,11 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.core.security import decode_access_token
+from app.models.audit_log import record_event
 from app.models.batch import get_batch_by_id
 from app.models.candidate import (
-    create_candidate, get_candidates_by_batch,
-    get_candidate_by_id, update_candidate,
+    claim_seat, create_candidate, get_candidates_by_batch,
+    get_candidate_by_id, release_seat, soft_delete_candidate, update_candidate,
 )
 from app.schemas.candidate_schemas import CandidateCreate, CandidateOut, ReviewRequest
 
@@ -66,7 +67,10 @@ def create(batch_id: str, body: CandidateCreate, user: dict = Depends(get_curren
         exception_count=body.exception_count,
         flagged=body.flagged,
         data=body.data,
+        actor=user.get("email", user.get("sub")),
     )
+    record_event("candidate.create", "candidate", c["id"], batch_id,
+                 actor=user.get("email", user.get("sub")), after=c)
     return CandidateOut(**c)
 
 
@@ -88,6 +92,8 @@ def update(batch_id: str, candidate_id: str, body: CandidateCreate, user: dict =
         "flagged": body.flagged,
         "data": body.data,
     })
+    record_event("candidate.update", "candidate", candidate_id, batch_id,
+                 actor=user.get("email", user.get("sub")), before=c, after=updated)
     return CandidateOut(**updated)
 
 
@@ -102,9 +108,34 @@ def review(batch_id: str, candidate_id: str, body: ReviewRequest, user: dict = D
     c = get_candidate_by_id(candidate_id)
     if not c or c["batch_id"] != batch_id:
         raise HTTPException(status_code=404, detail="Candidate not found.")
+    actor   = user.get("email", user.get("sub"))
     updated = update_candidate(candidate_id, {
         "review_status": body.review_status,
-        "reviewed_by":   user.get("email", user.get("sub")),
+        "reviewed_by":   actor,
         "review_note":   body.review_note,
     })
-    return CandidateOut(**updated)
\ No newline at end of file
+    # A rejection frees the seat for the waitlist; a reversal asks for it back.
+    if body.review_status == "rejected":
+        release_seat(updated, actor)
+    else:
+        claim_seat(updated, actor)
+    updated = get_candidate_by_id(candidate_id)
+    record_event("candidate.review", "candidate", candidate_id, batch_id,
+                 actor=actor, before=c, after=updated)
+    return CandidateOut(**updated)
+
+
+# ── DELETE (soft) ─────────────────────────────────────────────────────────────
+@router.delete("/{candidate_id}", status_code=204)
+def delete(batch_id: str, candidate_id: str, user: dict = Depends(get_current_user)):
+    """Admin or Manager only: soft-delete a candidate, freeing their seat."""
+    role = user.get("role", "user")
+    if role not in ("admin", "manager"):
+        raise HTTPException(status_code=403, detail="Only admin or manager can delete candidates.")
+    verify_batch(batch_id)
+    actor = user.get("email", user.get("sub"))
+    c     = get_candidate_by_id(candidate_id)
+    if not c or c["batch_id"] != batch_id or not soft_delete_candidate(c, actor):
+        raise HTTPException(status_code=404, detail="Candidate not found.")
+    record_event("candidate.delete", "candidate", candidate_id, batch_id,
+                 actor=actor, before={"deleted": False}, after={"deleted": True})
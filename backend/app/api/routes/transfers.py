@@ -0,0 +1,78 @@
+"""
+app/api/routes/transfers.py
+Move candidates between batches (admin or manager only).
+- POST /api/batches/{batch_id}/transfer  — move listed candidates into this batch
+- POST /api/batches/{batch_id}/merge     — move every candidate of another batch
+                                           into this batch
+Candidates are re-checked against the target batch's rules and intake size;
+the response reports the outcome for each candidate.
+"""
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.core.security import decode_access_token
+from app.models.audit_log import record_event
+from app.models.batch import get_batch_by_id
+from app.models.candidate import transfer_candidates
+from app.schemas.candidate_schemas import (
+    MergeRequest, TransferOutcome, TransferRequest, TransferResult,
+)
+
+router = APIRouter(prefix="/batches/{batch_id}", tags=["Transfers"])
+bearer = HTTPBearer()
+
+
+def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(bearer)) -> dict:
+    payload = decode_access_token(credentials.credentials)
+    if not payload:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token.")
+    return payload
+
+
+def require_reviewer(user: dict = Depends(get_current_user)) -> dict:
+    if user.get("role") not in ("admin", "manager"):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only admin or manager can move candidates.")
+    return user
+
+
+def _run_transfer(
+    target_id: str,
+    source_id: str,
+    candidate_ids: Optional[List[str]],
+    user: dict,
+) -> TransferResult:
+    if source_id == target_id:
+        raise HTTPException(status_code=422, detail="Source and target batch must differ.")
+    target = get_batch_by_id(target_id)
+    if not target:
+        raise HTTPException(status_code=404, detail="Batch not found.")
+    if not get_batch_by_id(source_id):
+        raise HTTPException(status_code=404, detail="Source batch not found.")
+
+    actor    = user.get("email", user.get("sub"))
+    outcomes = transfer_candidates(source_id, target, candidate_ids, actor=actor)
+
+    for outcome in outcomes:
+        if outcome["status"] == "moved":
+            record_event("candidate.transfer", "candidate", outcome["candidate_id"], target_id,
+                         actor=actor, before={"batch_id": source_id}, after={"batch_id": target_id})
+
+    return TransferResult(
+        target_batch_id=target_id,
+        moved=sum(1 for o in outcomes if o["status"] == "moved"),
+        outcomes=[TransferOutcome(**o) for o in outcomes],
+    )
+
+
+@router.post("/transfer", response_model=TransferResult)
+def transfer(batch_id: str, body: TransferRequest, user: dict = Depends(require_reviewer)):
+    """Move the listed candidates from source_batch_id into this batch."""
+    return _run_transfer(batch_id, body.source_batch_id, body.candidate_ids, user)
+
+
+@router.post("/merge", response_model=TransferResult)
+def merge(batch_id: str, body: MergeRequest, user: dict = Depends(require_reviewer)):
+    """Move every candidate of source_batch_id into this batch."""
+    return _run_transfer(batch_id, body.source_batch_id, None, user)
@@ -1,8 +1,11 @@
 """
 app/core/config.py
-Centralised settings – loaded once from .env file.
-Access anywhere with: from app.core.config import settings
+Centralised settings – loaded once from .env file on first use.
+Access anywhere with: from app.core.config import get_settings
+(`from app.core.config import settings` still works but reads .env at import.)
 """
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -13,6 +16,25 @@ class Settings(BaseSettings):
     ALGORITHM: str                   = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
 
+    # Connections opened up front by the startup warm-up.
+    MONGO_MIN_POOL_SIZE: int         = 5
+    MONGO_MAX_POOL_SIZE: int         = 100
+
+    # Audit log buffering – events are flushed with insert_many when the
+    # buffer reaches AUDIT_BUFFER_SIZE or every AUDIT_FLUSH_INTERVAL seconds.
+    AUDIT_BUFFER_SIZE: int           = 100
+    AUDIT_FLUSH_INTERVAL: float      = 2.0
+
+    # Archival & retention – see app/models/retention.py. 0 disables a limit.
+    ARCHIVE_DESTINATION: str         = "collection"   # collection | file (needs PII_RETENTION_DAYS=0)
+    ARCHIVE_DIR: str                 = "archive"
+    ARCHIVE_CHUNK_SIZE: int          = 1000
+    ARCHIVE_AFTER_DAYS: int          = 30    # deleted batches archived after
+    ARCHIVE_RETENTION_DAYS: int      = 0     # archived data expires after
+    PII_RETENTION_DAYS: int          = 365   # Aadhaar etc. purged after
+    RETENTION_INTERVAL: float        = 3600.0
+    ARCHIVE_CLAIM_TIMEOUT: float     = 900.0   # stale "archiving" claims are retried after
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -20,5 +42,14 @@ class Settings(BaseSettings):
     )
 
 
-# Singleton – imported everywhere
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Cached Settings – .env is read on first call, not at import."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    # Backwards-compatible `settings` singleton, resolved lazily.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
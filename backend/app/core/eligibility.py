@@ -0,0 +1,252 @@
+"""
+app/core/eligibility.py
+Server-side port of the form's eligibility checks (Frontend/form.js runRule).
+Used to re-validate stored candidates against another batch's rules_config.
+
+Each check returns (status, message) where status is one of:
+    "ok"    – passes
+    "none"  – optional field left empty
+    "warn"  – soft rule violated; needs an exception with a valid rationale
+    "error" – strict rule violated; candidate is ineligible
+"""
+import re
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+RATIONALE_MIN_LENGTH = 30
+RATIONALE_KEYWORDS   = ("approved by", "special case", "documentation pending", "waiver granted")
+FLAG_THRESHOLD       = 2   # candidates with more exceptions are flagged for review
+
+# Form fields holding personal data. The retention job unsets them after
+# PII_RETENTION_DAYS (setting `pii_purged_at`); their checks are then skipped.
+PII_FIELDS = ("aadhaar", "phone", "date_of_birth")
+PII_PURGED_NOTE = "Personal data purged; aadhaar, phone and date_of_birth checks skipped."
+
+NAME_DIGIT_RE     = re.compile(r"\d")
+EMAIL_RE          = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
+INDIAN_MOBILE_RE  = re.compile(r"^[6-9]\d{9}$")
+AADHAAR_RE        = re.compile(r"^\d{12}$")
+
+# Fields that are stored top-level on the candidate as well as inside `data`.
+TOP_LEVEL_FIELDS = {
+    "full_name":         "name",
+    "email":             "email",
+    "screening_score":   "screening_score",
+    "interview_status":  "interview_status",
+    "offer_letter_sent": "offer_letter_sent",
+}
+
+Result = Tuple[str, Optional[str]]
+
+
+def _blank(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def field_value(candidate: Dict[str, Any], field: str) -> Any:
+    """Read a form field from `data`, falling back to the top-level copy."""
+    value = (candidate.get("data") or {}).get(field)
+    if _blank(value) and field in TOP_LEVEL_FIELDS:
+        value = candidate.get(TOP_LEVEL_FIELDS[field])
+    return value
+
+
+def age_on(dob: date, today: date) -> int:
+    return today.year - dob.year - ((today.month, today.day) < (dob.month, dob.day))
+
+
+def is_valid_rationale(reason: Optional[str]) -> bool:
+    if not reason or len(reason) < RATIONALE_MIN_LENGTH:
+        return False
+    lowered = reason.lower()
+    return any(kw in lowered for kw in RATIONALE_KEYWORDS)
+
+
+# ── Rule checks ───────────────────────────────────────────────────────────────
+
+def _check_full_name(rule: dict, value: Any, candidate: dict, today: date) -> Result:
+    if _blank(value) or len(str(value).strip()) < rule.get("min_length", 2):
+        return "error", "Full name is required (min 2 characters)."
+    if rule.get("no_numbers", True) and NAME_DIGIT_RE.search(str(value)):
+        return "error", "Full name must not contain numbers."
+    return "ok", None
+
+
+def _check_email(rule: dict, value: Any, candidate: dict, today: date) -> Result:
+    if _blank(value):
+        return "error", "Email address is required."
+    if not EMAIL_RE.match(str(value)):
+        return "error", "Enter a valid email address."
+    return "ok", None
+
+
+def _check_phone(rule: dict, value: Any, candidate: dict, today: date) -> Result:
+    if _blank(value):
+        return "error", "Phone number is required."
+    if not INDIAN_MOBILE_RE.match(str(value).strip()):
+        return "error", "Enter a valid 10-digit Indian mobile number (starts with 6/7/8/9)."
+    return "ok", None
+
+
+def _check_date_of_birth(rule: dict, value: Any, candidate: dict, today: date) -> Result:
+    if _blank(value):
+        return "none", None
+    try:
+        dob = date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return "none", None
+    age     = age_on(dob, today)
+    min_age = rule.get("min_age", 18)
+    max_age = rule.get("max_age", 35)
+    if age < min_age or age > max_age:
+        return "warn", f"Candidate age ({age}) must be between {min_age} and {max_age} years."
+    return "ok", None
+
+
+def _check_qualification(rule: dict, value: Any, candidate: dict, today: date) -> Result:
+    if _blank(value):
+        return "error", "Please select a qualification."
+    allowed = rule.get("allowed")
+    if allowed and value not in allowed:
+        return "error", f"Qualification must be one of: {', '.join(allowed)}."
+    return "ok", None
+
+
+def _check_graduation_year(rule: dict, value: Any, candidate: dict, today: date) -> Result:
+    year = _number(value)
+    if year is None:
+        return "none", None
+    lo, hi = rule.get("min", 2015), rule.get("max", 2025)
+    if year < lo or year > hi:
+        return "warn", f"Graduation year must be between {lo} and {hi}."
+    return "ok", None
+
+
+def _check_percentage_cgpa(rule: dict, value: Any, candidate: dict, today: date) -> Result:
+    num = _number(value)
+    if num is None:
+        return "none", None
+    if (candidate.get("data") or {}).get("score_mode", "percent") == "percent":
+        lo = rule.get("min_percent", 60)
+        if num < lo:
+            return "warn", f"Percentage must be ≥ {lo}%. Entered: {num}%."
+    else:
+        lo = rule.get("min_cgpa", 6.0)
+        if num < lo:
+            return "warn", f"CGPA must be ≥ {lo} (10-point scale). Entered: {num}."
+    return "ok", None
+
+
+def _check_screening_score(rule: dict, value: Any, candidate: dict, today: date) -> Result:
+    score = _number(value)
+    if score is None:
+        return "none", None
+    lo = rule.get("min", 40)
+    if score < lo:
+        return "warn", f"Screening score must be ≥ {lo}/100. Entered: {score}."
+    return "ok", None
+
+
+def _check_interview_status(rule: dict, value: Any, candidate: dict, today: date) -> Result:
+    if _blank(value):
+        return "error", "Interview status is required."
+    if value == "Rejected":
+        return "error", "Candidate is Rejected. Submission blocked."
+    allowed = rule.get("allowed")
+    if allowed and value not in allowed:
+        return "error", f"Status must be one of: {', '.join(allowed)}."
+    return "ok", None
+
+
+def _check_aadhaar(rule: dict, value: Any, candidate: dict, today: date) -> Result:
+    if _blank(value):
+        return "error", "Aadhaar number is required."
+    if not AADHAAR_RE.match(str(value).strip()):
+        return "error", "Aadhaar must be exactly 12 digits with no letters."
+    return "ok", None
+
+
+def _check_offer_letter(rule: dict, value: Any, candidate: dict, today: date) -> Result:
+    if value is None:
+        return "none", None
+    if value is not True:
+        return "ok", None
+    allowed = (rule.get("depends_on") or {}).get("interview_status", ["Cleared", "Waitlisted"])
+    if field_value(candidate, "interview_status") not in allowed:
+        return "error", "Offer letter can only be 'Yes' if Interview Status is Cleared or Waitlisted."
+    return "ok", None
+
+
+# rules_config key → (form field holding the value, check)
+CHECKS = {
+    "full_name":        ("full_name",         _check_full_name),
+    "email":            ("email",             _check_email),
+    "phone":            ("phone",             _check_phone),
+    "date_of_birth":    ("date_of_birth",     _check_date_of_birth),
+    "qualification":    ("qualification",     _check_qualification),
+    "graduation_year":  ("graduation_year",   _check_graduation_year),
+    "percentage_cgpa":  ("percentage_cgpa",   _check_percentage_cgpa),
+    "screening_score":  ("screening_score",   _check_screening_score),
+    "interview_status": ("interview_status",  _check_interview_status),
+    "aadhaar":          ("aadhaar",           _check_aadhaar),
+    "offer_letter":     ("offer_letter_sent", _check_offer_letter),
+}
+
+
+def assess_candidate(
+    candidate: Dict[str, Any],
+    rules_config: Dict[str, Any],
+    today: Optional[date] = None,
+) -> Tuple[List[str], int]:
+    """
+    Check a stored candidate against a rules_config.
+    Returns (problems, exception_count): the blocking problems – strict
+    errors plus soft warnings not excused by a recorded exception with a
+    valid rationale – and how many soft warnings were excused.
+    Checks on PII_FIELDS are skipped once the candidate's PII was purged.
+    """
+    today      = today or date.today()
+    exceptions = (candidate.get("data") or {}).get("exceptions") or {}
+    purged     = is_pii_purged(candidate)
+    problems: List[str] = []
+    excused    = 0
+
+    for key, (field, check) in CHECKS.items():
+        rule = rules_config.get(key)
+        if not rule or (purged and field in PII_FIELDS):
+            continue
+        status, msg = check(rule, field_value(candidate, field), candidate, today)
+        if status == "error":
+            problems.append(msg)
+        elif status == "warn":
+            exc = exceptions.get(field) or {}
+            if exc.get("checked") and is_valid_rationale(exc.get("reason")):
+                excused += 1
+            else:
+                problems.append(f"{msg} Exception required.")
+    return problems, excused
+
+
+def is_pii_purged(candidate: Dict[str, Any]) -> bool:
+    return candidate.get("pii_purged_at") is not None
+
+
+def evaluate_candidate(
+    candidate: Dict[str, Any],
+    rules_config: Dict[str, Any],
+    today: Optional[date] = None,
+) -> List[str]:
+    """Blocking problems only (see assess_candidate). Empty means eligible."""
+    return assess_candidate(candidate, rules_config, today)[0]
+
+
+def is_flagged(exception_count: int) -> bool:
+    """Same threshold as the form: more than FLAG_THRESHOLD exceptions."""
+    return exception_count > FLAG_THRESHOLD
@@ -1,26 +1,42 @@
 """
 app/core/security.py
 Password hashing and JWT token utilities.
+passlib/bcrypt and python-jose/cryptography are imported on first use so they
+stay off the import path; warm_up() loads them ahead of the first request.
 """
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from app.core.config import get_settings
 
-from app.core.config import settings
 
-_pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
+@lru_cache(maxsize=1)
+def _pwd_ctx():
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+@lru_cache(maxsize=1)
+def _jose():
+    from jose import JWTError, jwt
+    return jwt, JWTError
+
+
+def warm_up() -> None:
+    """Import and initialise the hashing and JWT backends."""
+    _pwd_ctx().hash("warm-up")
+    _jose()
 
 
 # ── Password ──────────────────────────────────────────────────────────────────
 
 def hash_password(plain: str) -> str:
-    return _pwd_ctx.hash(plain)
+    return _pwd_ctx().hash(plain)
 
 
 def verify_password(plain: str, hashed: str) -> bool:
-    return _pwd_ctx.verify(plain, hashed)
+    return _pwd_ctx().verify(plain, hashed)
 
 
 # ── JWT ───────────────────────────────────────────────────────────────────────
@@ -29,8 +45,10 @@ def create_access_token(
     data: dict,
     expires_delta: Optional[timedelta] = None,
 ) -> str:
-    payload = data.copy()
-    expire  = datetime.utcnow() + (
+    settings = get_settings()
+    jwt, _   = _jose()
+    payload  = data.copy()
+    expire   = datetime.utcnow() + (
         expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     payload["exp"] = expire
@@ -39,6 +57,8 @@ def create_access_token(
 
 def decode_access_token(token: str) -> Optional[dict]:
     """Returns the decoded payload or None if invalid/expired."""
+    settings      = get_settings()
+    jwt, JWTError = _jose()
     try:
         return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
     except JWTError:
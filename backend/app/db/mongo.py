@@ -8,22 +8,55 @@ Import get_db() wherever you need a collection:
     col = db["my_collection"]
 """
 from functools import lru_cache
+from typing import Callable, Optional, TypeVar
 
 from pymongo import MongoClient
+from pymongo.client_session import ClientSession
 from pymongo.database import Database
 
-from app.core.config import settings
+from app.core.config import get_settings
+
+T = TypeVar("T")
+
+# Topologies that accept multi-document transactions.
+_TRANSACTIONAL_TOPOLOGIES = {"ReplicaSetWithPrimary", "Sharded", "LoadBalanced"}
 
 
 @lru_cache(maxsize=1)
 def _get_client() -> MongoClient:
     """Cached MongoClient – created once per process."""
-    return MongoClient(settings.MONGO_URI)
+    settings = get_settings()
+    return MongoClient(
+        settings.MONGO_URI,
+        minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+        maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+    )
 
 
 def get_db() -> Database:
     """Return the application database."""
-    return _get_client()[settings.DB_NAME]
+    return _get_client()[get_settings().DB_NAME]
+
+
+def ping() -> None:
+    """Round-trip to the server; raises PyMongoError if unreachable."""
+    _get_client().admin.command("ping")
+
+
+def supports_transactions() -> bool:
+    """True when connected to a replica set or mongos (not a standalone)."""
+    return _get_client().topology_description.topology_type_name in _TRANSACTIONAL_TOPOLOGIES
+
+
+def run_in_transaction(callback: Callable[[Optional[ClientSession]], T]) -> T:
+    """
+    Run callback(session) inside a transaction, retried on transient errors.
+    On a standalone server there are no transactions: callback(None) runs as is.
+    """
+    if not supports_transactions():
+        return callback(None)
+    with _get_client().start_session() as session:
+        return session.with_transaction(callback)
 
 
 def close_db() -> None:
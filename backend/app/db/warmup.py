@@ -0,0 +1,81 @@
+"""
+app/db/warmup.py
+Startup warm-up and readiness state.
+The warm-up runs in a background thread so the process starts serving the
+`/` liveness check immediately; `/ready` reports 503 until it has finished:
+
+    - connect to MongoDB and fill the pool up to MONGO_MIN_POOL_SIZE
+    - create every collection's indexes
+    - load the bcrypt and JWT backends
+"""
+import logging
+import threading
+from typing import Optional
+
+from pymongo.errors import PyMongoError
+
+from app.core import security
+from app.db.mongo import ping
+from app.models import audit_log, batch, candidate, retention, seats, user
+
+logger = logging.getLogger(__name__)
+
+_MAX_RETRY_DELAY = 30.0
+
+_ready  = threading.Event()
+_stop   = threading.Event()
+_thread: Optional[threading.Thread] = None
+
+
+def warm_up() -> None:
+    """Run every warm-up step synchronously. Raises PyMongoError on failure."""
+    ping()
+    for model in (user, batch, candidate, seats, audit_log, retention):
+        model.ensure_indexes()
+    security.warm_up()
+
+
+def _run() -> None:
+    delay = 1.0
+    while not _stop.is_set():
+        try:
+            warm_up()
+        except PyMongoError:
+            logger.warning("Warm-up failed; retrying in %.0fs.", delay, exc_info=True)
+            _stop.wait(delay)
+            delay = min(delay * 2, _MAX_RETRY_DELAY)
+            continue
+        except Exception:
+            # Not a connectivity problem (e.g. a broken auth backend) – retrying
+            # won't help, so stay unready and say why.
+            logger.exception("Warm-up failed; /ready will keep reporting 503.")
+            return
+        _ready.set()
+        logger.info("Warm-up complete; ready to serve.")
+        return
+
+
+def start_warm_up() -> None:
+    """Kick off the warm-up thread. Call on application startup."""
+    global _thread
+    if _thread and _thread.is_alive():
+        return
+    _stop.clear()
+    _thread = threading.Thread(target=_run, name="warm-up", daemon=True)
+    _thread.start()
+
+
+def stop_warm_up() -> None:
+    """
+    Abandon a warm-up still retrying and wait for its thread, so it cannot
+    reopen the Mongo pool after close_db(). Call on application shutdown.
+    """
+    global _thread
+    _stop.set()
+    if _thread:
+        _thread.join()
+        _thread = None
+
+
+def is_ready() -> bool:
+    return _ready.is_set()
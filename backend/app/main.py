@@ -4,9 +4,13 @@ FastAPI application factory.
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.api.router import api_router
 from app.db.mongo import close_db
+from app.db.warmup import is_ready, start_warm_up, stop_warm_up
+from app.models.audit_log import start_audit_flusher, stop_audit_flusher
+from app.models.retention import start_retention_worker, stop_retention_worker
 
 
 def create_app() -> FastAPI:
@@ -22,14 +26,31 @@ def create_app() -> FastAPI:
 
     app.include_router(api_router)
 
+    @app.on_event("startup")
+    def on_startup():
+        start_warm_up()
+        start_audit_flusher()
+        start_retention_worker()
+
     @app.on_event("shutdown")
     def on_shutdown():
+        stop_warm_up()
+        stop_retention_worker()
+        stop_audit_flusher()
         close_db()
 
     @app.get("/", tags=["Health"])
     def health():
+        """Liveness: the process is up. Does not touch MongoDB."""
         return {"status": "ok", "service": "AdmitGuard API"}
 
+    @app.get("/ready", tags=["Health"])
+    def ready():
+        """Readiness: pool, indexes and auth backends are warmed up."""
+        if not is_ready():
+            return JSONResponse(status_code=503, content={"status": "warming_up"})
+        return {"status": "ready"}
+
     return app
 
 
@@ -0,0 +1,224 @@
+"""
+app/models/audit_log.py
+Append-only audit trail for batch and candidate changes.
+Events are buffered in memory and written with insert_many – either when the
+buffer fills up or on a timer – so recording an event never waits on MongoDB.
+"""
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo.errors import BulkWriteError, PyMongoError
+
+from app.core.config import get_settings
+from app.core.eligibility import PII_FIELDS
+from app.db.mongo import get_db
+
+logger = logging.getLogger(__name__)
+
+# Bookkeeping fields that change on every write and carry no review value.
+_IGNORED_FIELDS = {"id", "_id", "created_at", "updated_at"}
+
+# The audit log is append-only, so it records that PII_FIELDS changed but
+# never their values.
+_MASKED    = {f"data.{name}" for name in PII_FIELDS}
+_REDACTED  = "[redacted]"
+
+_DUPLICATE_KEY = 11000
+
+
+def _audit_logs():
+    return get_db()["audit_log"]
+
+
+def ensure_indexes() -> None:
+    """Create audit log indexes. Run once at startup (see app/db/warmup.py)."""
+    col = _audit_logs()
+    col.create_index([("batch_id", 1), ("created_at", -1)])
+    col.create_index([("entity_id", 1), ("created_at", -1)])
+
+
+# ── Buffer ────────────────────────────────────────────────────────────────────
+
+class _AuditBuffer:
+    """Thread-safe event buffer drained by a background flusher thread."""
+
+    def __init__(self) -> None:
+        self._events: List[dict] = []
+        self._lock   = threading.Lock()
+        self._wake   = threading.Event()
+        self._stop   = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def append(self, event: dict) -> None:
+        with self._lock:
+            self._events.append(event)
+            full = len(self._events) >= get_settings().AUDIT_BUFFER_SIZE
+        if not full:
+            return
+        if self._thread and self._thread.is_alive():
+            self._wake.set()
+        else:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all buffered events. Returns the number of events written."""
+        with self._lock:
+            if not self._events:
+                return 0
+            events, self._events = self._events, []
+
+        try:
+            _audit_logs().insert_many(events, ordered=False)
+            return len(events)
+        except BulkWriteError as exc:
+            # insert_many assigns _id client-side, so a retried event that
+            # already landed shows up as a duplicate and must not be requeued.
+            failed = sorted(
+                err["index"] for err in exc.details.get("writeErrors", [])
+                if err.get("code") != _DUPLICATE_KEY
+            )
+            requeue = [events[i] for i in failed]
+            if requeue:
+                logger.exception("Audit flush failed; requeueing %d event(s).", len(requeue))
+        except PyMongoError:
+            requeue = events
+            logger.exception("Audit flush failed; requeueing %d event(s).", len(requeue))
+
+        if requeue:
+            with self._lock:
+                self._events[:0] = requeue
+        return len(events) - len(requeue)
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(get_settings().AUDIT_FLUSH_INTERVAL)
+            self._wake.clear()
+            self.flush()
+
+
+_buffer = _AuditBuffer()
+
+
+def start_audit_flusher() -> None:
+    """Start the background flusher. Call on application startup."""
+    _buffer.start()
+
+
+def stop_audit_flusher() -> None:
+    """Stop the flusher and write any pending events. Call on shutdown."""
+    _buffer.stop()
+
+
+def flush_audit_log() -> int:
+    """Synchronously write any pending events."""
+    return _buffer.flush()
+
+
+# ── Recording ─────────────────────────────────────────────────────────────────
+
+def _flatten(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Lift `data` sub-fields to the top level so edits diff per form field."""
+    flat: Dict[str, Any] = {}
+    for key, value in doc.items():
+        if key in _IGNORED_FIELDS:
+            continue
+        if key == "data" and isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                flat[f"data.{sub_key}"] = sub_value
+        else:
+            flat[key] = value
+    return flat
+
+
+def _mask(field: str, value: Any) -> Any:
+    return _REDACTED if field in _MASKED and value is not None else value
+
+
+def diff_fields(before: Dict[str, Any], after: Dict[str, Any]) -> List[dict]:
+    """
+    Return [{field, old, new}] for every field whose value changed.
+    PII_FIELDS values are replaced with "[redacted]".
+    """
+    old, new = _flatten(before), _flatten(after)
+    return [
+        {"field": key, "old": _mask(key, old.get(key)), "new": _mask(key, new.get(key))}
+        for key in sorted(old.keys() | new.keys())
+        if old.get(key) != new.get(key)
+    ]
+
+
+def record_event(
+    action: str,
+    entity_type: str,
+    entity_id: str,
+    batch_id: str,
+    actor: Optional[str],
+    before: Optional[Dict[str, Any]] = None,
+    after:  Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Queue an audit event. Returns immediately; the write happens on flush.
+    Updates that change nothing are not recorded.
+    """
+    changes = diff_fields(before or {}, after or {})
+    if before is not None and not changes:
+        return
+    _buffer.append({
+        "action":      action,
+        "entity_type": entity_type,
+        "entity_id":   entity_id,
+        "batch_id":    batch_id,
+        "actor":       actor,
+        "changes":     changes,
+        "created_at":  datetime.utcnow(),
+    })
+
+
+# ── Queries ───────────────────────────────────────────────────────────────────
+
+def get_audit_events(
+    skip: int,
+    limit: int,
+    batch_id:  Optional[str] = None,
+    entity_id: Optional[str] = None,
+) -> Tuple[List[dict], int]:
+    """
+    Newest-first page of events for a batch and/or entity, plus the total.
+    Pending events are flushed first so callers see their own writes.
+    """
+    flush_audit_log()
+
+    query: Dict[str, Any] = {}
+    if batch_id:
+        query["batch_id"] = batch_id
+    if entity_id:
+        query["entity_id"] = entity_id
+
+    col   = _audit_logs()
+    total = col.count_documents(query)
+    docs  = col.find(query).sort("created_at", -1).skip(skip).limit(limit)
+    return [_serialize(d) for d in docs], total
+
+
+def _serialize(doc: dict) -> dict:
+    doc["id"] = str(doc.pop("_id"))
+    if isinstance(doc.get("created_at"), datetime):
+        doc["created_at"] = doc["created_at"].isoformat()
+    return doc
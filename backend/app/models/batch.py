@@ -3,7 +3,7 @@ app/models/batch.py
 Low-level Batch CRUD operations against MongoDB.
 """
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from bson import ObjectId
 
@@ -79,6 +79,14 @@ def _batches():
     return get_db()["batches"]
 
 
+def ensure_indexes() -> None:
+    """Create batch indexes. Run once at startup (see app/db/warmup.py)."""
+    col = _batches()
+    col.create_index([("created_at", -1)])
+    col.create_index([("created_by", 1), ("created_at", -1)])
+    col.create_index([("program", 1), ("created_at", -1)])
+
+
 def create_batch(
     name: str,
     program: str,
@@ -92,6 +100,7 @@ def create_batch(
         "program":      program,
         "start_date":   start_date,
         "intake_size":  intake_size,
+        "seats_taken":  0,
         "created_by":   created_by,
         "rules_config": rules_config if rules_config is not None else DEFAULT_RULES_CONFIG,
         "created_at":   datetime.utcnow(),
@@ -101,21 +110,101 @@ def create_batch(
     return _serialize(doc)
 
 
-def get_all_batches(created_by: Optional[str] = None) -> list:
-    query = {"created_by": created_by} if created_by else {}
-    docs  = _batches().find(query).sort("created_at", -1)
-    return [_serialize(d) for d in docs]
+def list_batch_summaries(
+    skip: int,
+    limit: int,
+    created_by: Optional[str] = None,
+    program: Optional[str] = None,
+    include_rules: bool = False,
+) -> Tuple[List[dict], Dict[str, int]]:
+    """
+    One page of batches (newest first) plus totals over every match:
+    {total, total_intake, program_count}.
+    Each batch carries candidate_count / flagged_count from a single
+    aggregation; rules_config is projected out unless include_rules is set.
+    """
+    match: Dict[str, Any] = {"deleted_at": None}
+    if created_by:
+        match["created_by"] = created_by
+    if program:
+        match["program"] = program
 
+    project: Dict[str, Any] = {
+        "name": 1, "program": 1, "start_date": 1, "intake_size": 1,
+        "seats_taken": 1, "created_by": 1, "created_at": 1,
+        "has_custom_rules": {"$ne": ["$rules_config", {"$literal": DEFAULT_RULES_CONFIG}]},
+    }
+    if include_rules:
+        project["rules_config"] = 1
 
-def get_batch_by_id(batch_id: str) -> Optional[dict]:
+    page = [
+        {"$skip": skip},
+        {"$limit": limit},
+        {"$project": project},
+        {"$lookup": {
+            "from": "candidates",
+            "let":  {"bid": {"$toString": "$_id"}},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$batch_id", "$$bid"]}, "deleted_at": None}},
+                {"$group": {
+                    "_id":     None,
+                    "total":   {"$sum": 1},
+                    "flagged": {"$sum": {"$cond": ["$flagged", 1, 0]}},
+                }},
+            ],
+            "as": "counts",
+        }},
+    ]
+    pipeline = [
+        {"$match": match},
+        {"$sort": {"created_at": -1}},
+        {"$facet": {
+            "items": page,
+            "stats": [{"$group": {
+                "_id":      None,
+                "total":    {"$sum": 1},
+                "intake":   {"$sum": "$intake_size"},
+                "programs": {"$addToSet": "$program"},
+            }}],
+        }},
+    ]
+
+    result = next(_batches().aggregate(pipeline), {"items": [], "stats": []})
+    items  = []
+    for doc in result["items"]:
+        counts = doc.pop("counts")
+        doc["candidate_count"] = counts[0]["total"] if counts else 0
+        doc["flagged_count"]   = counts[0]["flagged"] if counts else 0
+        items.append(_serialize(doc))
+    stats = result["stats"][0] if result["stats"] else {}
+    return items, {
+        "total":         stats.get("total", 0),
+        "total_intake":  stats.get("intake", 0),
+        "program_count": len(stats.get("programs", [])),
+    }
+
+
+def get_batch_by_id(batch_id: str, include_deleted: bool = False) -> Optional[dict]:
     try:
         oid = ObjectId(batch_id)
     except Exception:
         return None
-    doc = _batches().find_one({"_id": oid})
+    query: Dict[str, Any] = {"_id": oid}
+    if not include_deleted:
+        query["deleted_at"] = None
+    doc = _batches().find_one(query)
     return _serialize(doc) if doc else None
 
 
+def soft_delete_batch(batch_id: str) -> bool:
+    """Mark a batch deleted (closed). Returns False if already deleted or unknown."""
+    result = _batches().update_one(
+        {"_id": ObjectId(batch_id), "deleted_at": None},
+        {"$set": {"deleted_at": datetime.utcnow()}},
+    )
+    return result.modified_count == 1
+
+
 def _serialize(doc: dict) -> dict:
     doc["id"] = str(doc.pop("_id"))
     return doc
\ No newline at end of file
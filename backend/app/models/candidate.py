@@ -8,15 +8,26 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from bson import ObjectId
+from pymongo import UpdateOne
 
-from app.db.mongo import get_db
+from app.core.eligibility import PII_PURGED_NOTE, assess_candidate, is_flagged, is_pii_purged
+from app.db.mongo import get_db, run_in_transaction
+from app.models.audit_log import record_event
+from app.models.seats import (
+    RELEASED, SEATED, WAITLIST_SORT, WAITLISTED,
+    promote_from_waitlist, release_seats, reserve_seats,
+)
 
 
 def _candidates():
-    col = get_db()["candidates"]
+    return get_db()["candidates"]
+
+
+def ensure_indexes() -> None:
+    """Create candidate indexes. Run once at startup (see app/db/warmup.py)."""
+    col = _candidates()
     col.create_index("batch_id")
     col.create_index("email")
-    return col
 
 
 def create_candidate(
@@ -29,9 +40,12 @@ def create_candidate(
     offer_letter_sent: Optional[bool] = None,
     exception_count:  int             = 0,
     flagged:          bool            = False,
+    actor:            Optional[str]   = None,
 ) -> dict:
-    now = datetime.utcnow()
-    doc = {
+    """Insert a candidate, taking a seat if one is free, else waitlisting."""
+    seated = reserve_seats(batch_id) == 1
+    now    = datetime.utcnow()
+    doc    = {
         "batch_id":          batch_id,
         "name":              name,
         "email":             email,
@@ -43,17 +57,39 @@ def create_candidate(
         "review_status":     None,
         "reviewed_by":       None,
         "review_note":       None,
+        "seat_status":       SEATED if seated else WAITLISTED,
         "data":              data,   # stores ALL form fields
         "created_at":        now,
         "updated_at":        now,
     }
-    result = _candidates().insert_one(doc)
+    try:
+        result = _candidates().insert_one(doc)
+    except Exception:
+        if seated:
+            release_seats(batch_id)
+        raise
     doc["_id"] = result.inserted_id
+    if not seated:
+        # A seat freed while we were inserting found nobody to promote.
+        if str(doc["_id"]) in _promote(batch_id, actor):
+            doc["seat_status"] = SEATED
     return _serialize(doc)
 
 
 def get_candidates_by_batch(batch_id: str) -> List[dict]:
-    docs = _candidates().find({"batch_id": batch_id}).sort("created_at", -1)
+    docs = _candidates().find({"batch_id": batch_id, "deleted_at": None}).sort("created_at", -1)
+    return [_serialize(d) for d in docs]
+
+
+def get_waitlist(batch_id: str, skip: int, limit: int) -> List[dict]:
+    """Waitlisted candidates in promotion order (served from the waitlist index)."""
+    docs = (
+        _candidates()
+        .find({"batch_id": batch_id, "seat_status": WAITLISTED, "deleted_at": None})
+        .sort(WAITLIST_SORT)
+        .skip(skip)
+        .limit(limit)
+    )
     return [_serialize(d) for d in docs]
 
 
@@ -62,7 +98,7 @@ def get_candidate_by_id(candidate_id: str) -> Optional[dict]:
         oid = ObjectId(candidate_id)
     except Exception:
         return None
-    doc = _candidates().find_one({"_id": oid})
+    doc = _candidates().find_one({"_id": oid, "deleted_at": None})
     return _serialize(doc) if doc else None
 
 
@@ -77,10 +113,170 @@ def update_candidate(candidate_id: str, updates: Dict[str, Any]) -> Optional[dic
         return None
 
     updates["updated_at"] = datetime.utcnow()
-    _candidates().update_one({"_id": oid}, {"$set": updates})
+    _candidates().update_one({"_id": oid, "deleted_at": None}, {"$set": updates})
     return get_candidate_by_id(candidate_id)
 
 
+def soft_delete_candidate(candidate: dict, actor: Optional[str] = None) -> bool:
+    """Mark a candidate deleted and hand any seat it held to the waitlist."""
+    result = _candidates().update_one(
+        {"_id": ObjectId(candidate["id"]), "deleted_at": None},
+        {"$set": {"deleted_at": datetime.utcnow()}},
+    )
+    if not result.modified_count:
+        return False
+    release_seat(candidate, actor)
+    return True
+
+
+def soft_delete_batch_candidates(batch_id: str) -> int:
+    """Mark every candidate of a (deleted) batch deleted. Returns the count."""
+    result = _candidates().update_many(
+        {"batch_id": batch_id, "deleted_at": None},
+        {"$set": {"deleted_at": datetime.utcnow()}},
+    )
+    return result.modified_count
+
+
+def _record_seat(candidate_id: str, batch_id: str, actor: Optional[str], old: str, new: str) -> None:
+    record_event("candidate.seat", "candidate", candidate_id, batch_id, actor=actor,
+                 before={"seat_status": old}, after={"seat_status": new})
+
+
+def _promote(batch_id: str, actor: Optional[str]) -> List[str]:
+    """promote_from_waitlist, leaving a candidate.seat audit event per promotion."""
+    promoted = promote_from_waitlist(batch_id)
+    for cid in promoted:
+        _record_seat(cid, batch_id, actor, WAITLISTED, SEATED)
+    return promoted
+
+
+def release_seat(candidate: dict, actor: Optional[str] = None) -> None:
+    """Free a seated candidate's seat and promote the next waitlisted one."""
+    if candidate.get("seat_status") != SEATED:
+        return
+    result = _candidates().update_one(
+        {"_id": ObjectId(candidate["id"]), "seat_status": SEATED},
+        {"$set": {"seat_status": RELEASED, "updated_at": datetime.utcnow()}},
+    )
+    if result.modified_count:
+        _record_seat(candidate["id"], candidate["batch_id"], actor, SEATED, RELEASED)
+        release_seats(candidate["batch_id"])
+        _promote(candidate["batch_id"], actor)
+
+
+def claim_seat(candidate: dict, actor: Optional[str] = None) -> None:
+    """Seat a released candidate again, or waitlist them if the batch is full."""
+    if candidate.get("seat_status") != RELEASED:
+        return
+    seated = reserve_seats(candidate["batch_id"]) == 1
+    result = _candidates().update_one(
+        {"_id": ObjectId(candidate["id"]), "seat_status": RELEASED},
+        {"$set": {"seat_status": SEATED if seated else WAITLISTED, "updated_at": datetime.utcnow()}},
+    )
+    if seated and not result.modified_count:
+        release_seats(candidate["batch_id"])
+    elif not seated and result.modified_count:
+        # Same gap as in create_candidate: a seat may have freed meanwhile.
+        _promote(candidate["batch_id"], actor)
+
+
+def transfer_candidates(
+    source_batch_id: str,
+    target_batch: dict,
+    candidate_ids: Optional[List[str]] = None,
+    actor: Optional[str] = None,
+) -> List[dict]:
+    """
+    Move candidates from one batch into another (None ids = the whole batch).
+    Each candidate is re-checked against the target's rules_config; eligible
+    ones move in one bulk_write (inside a transaction where the deployment
+    supports it), with flagged/exception_count recomputed under its rules.
+    Candidates keep their seat_status: seated ones need a free seat in the
+    target (oldest first), waitlisted ones join the target's waitlist in
+    score order, released ones stay released. Seats freed in the source go
+    to its waitlist.
+    Returns one {candidate_id, status, errors, notes} outcome per requested
+    id, with status "moved", "not_found", "ineligible" or "batch_full";
+    notes say when PII checks were skipped for a purged candidate.
+    """
+    target_id = target_batch["id"]
+    rules     = target_batch["rules_config"]
+
+    query: Dict[str, Any] = {"batch_id": source_batch_id, "deleted_at": None}
+    if candidate_ids is not None:
+        candidate_ids = list(dict.fromkeys(candidate_ids))
+        query["_id"] = {"$in": [ObjectId(cid) for cid in candidate_ids if ObjectId.is_valid(cid)]}
+
+    def _transfer(session) -> List[dict]:
+        col  = _candidates()
+        docs = [_serialize(d) for d in col.find(query, session=session).sort("created_at", 1)]
+
+        outcomes: Dict[str, dict] = {}
+        eligible: Dict[str, int]  = {}   # id → exception_count under the target's rules
+        for doc in docs:
+            problems, exception_count = assess_candidate(doc, rules)
+            if problems:
+                outcomes[doc["id"]] = {"candidate_id": doc["id"], "status": "ineligible", "errors": problems}
+            else:
+                eligible[doc["id"]] = exception_count
+
+        seat_status = {d["id"]: d.get("seat_status") for d in docs}
+        need_seat   = [cid for cid in eligible if seat_status[cid] == SEATED]
+        granted     = reserve_seats(target_id, len(need_seat), session=session) if need_seat else 0
+        no_room     = set(need_seat[granted:])
+        moving      = [cid for cid in eligible if cid not in no_room]
+        for cid in need_seat[granted:]:
+            outcomes[cid] = {"candidate_id": cid, "status": "batch_full", "errors": []}
+
+        now = datetime.utcnow()
+        ops = [
+            UpdateOne(
+                # Matching seat_status too keeps the seat accounting above valid.
+                {"_id": ObjectId(cid), "batch_id": source_batch_id, "deleted_at": None,
+                 "seat_status": seat_status[cid]},
+                {"$set": {
+                    "batch_id":        target_id,
+                    "exception_count": eligible[cid],
+                    "flagged":         is_flagged(eligible[cid]),
+                    "updated_at":      now,
+                }},
+            )
+            for cid in moving
+        ]
+        moved_ids = set(moving)
+        if ops and col.bulk_write(ops, ordered=False, session=session).matched_count < len(ops):
+            # Without a transaction a candidate can change after the find;
+            # only count those that really landed in the target.
+            landed = col.find(
+                {"_id": {"$in": [ObjectId(cid) for cid in moving]}, "batch_id": target_id},
+                {"_id": 1}, session=session,
+            )
+            moved_ids = {str(d["_id"]) for d in landed}
+            unused    = sum(1 for cid in moving if cid not in moved_ids and seat_status[cid] == SEATED)
+            release_seats(target_id, unused, session=session)
+
+        freed = sum(1 for cid in moved_ids if seat_status[cid] == SEATED)
+        release_seats(source_batch_id, freed, session=session)
+        for cid in moved_ids:
+            outcomes[cid] = {"candidate_id": cid, "status": "moved", "errors": []}
+
+        for doc in docs:
+            if doc["id"] in outcomes:
+                outcomes[doc["id"]]["notes"] = [PII_PURGED_NOTE] if is_pii_purged(doc) else []
+
+        order = candidate_ids if candidate_ids is not None else [d["id"] for d in docs]
+        return [
+            outcomes.get(cid, {"candidate_id": cid, "status": "not_found", "errors": [], "notes": []})
+            for cid in order
+        ]
+
+    outcomes = run_in_transaction(_transfer)
+    _promote(source_batch_id, actor)
+    _promote(target_id, actor)   # in case waitlisted arrivals found free seats
+    return outcomes
+
+
 def _serialize(doc: dict) -> dict:
     doc["id"] = str(doc.pop("_id"))
     # Convert datetimes to ISO strings
@@ -0,0 +1,284 @@
+"""
+app/models/retention.py
+Archival and data retention, keeping the hot collections small.
+
+- archive_batch() moves a deleted (closed) batch and all its candidates out
+  of `batches` / `candidates`, chunk by chunk, into `batches_archive` /
+  `candidates_archive` or gzipped NDJSON files under ARCHIVE_DIR.
+- purge_expired_pii() strips PII_FIELDS from candidates older than
+  PII_RETENTION_DAYS, in both the hot and the archive collection.
+  File archives cannot be purged in place, so they are refused while
+  PII_RETENTION_DAYS is set.
+- Archived data expires after ARCHIVE_RETENTION_DAYS: a TTL index on
+  `archived_at` for the collections, file age for the NDJSON files.
+
+A background worker runs all passes every RETENTION_INTERVAL seconds.
+"""
+import gzip
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from bson import ObjectId, json_util
+from pymongo.errors import BulkWriteError, OperationFailure
+
+from app.core.config import get_settings
+from app.core.eligibility import PII_FIELDS
+from app.db.mongo import get_db
+
+logger = logging.getLogger(__name__)
+
+COLLECTION = "collection"
+FILE       = "file"
+
+_DUPLICATE_KEY          = 11000
+_INDEX_OPTIONS_CONFLICT = 85
+
+# Set on shutdown; long passes check it between chunks and stop early.
+_stop   = threading.Event()
+_thread: Optional[threading.Thread] = None
+
+
+def _batches():
+    return get_db()["batches"]
+
+
+def _candidates():
+    return get_db()["candidates"]
+
+
+def _archive(name: str):
+    return get_db()[f"{name}_archive"]
+
+
+def ensure_indexes() -> None:
+    """Create archive and retention indexes. Run once at startup (see app/db/warmup.py)."""
+    # Serves the PII sweep: purged candidates fall out of the
+    # {pii_purged_at: null} range, so each pass only scans what is left.
+    for col in (_candidates(), _archive("candidates")):
+        col.create_index([("pii_purged_at", 1), ("created_at", 1)])
+    _batches().create_index([("deleted_at", 1)])
+    _archive("candidates").create_index("batch_id")
+
+    days = get_settings().ARCHIVE_RETENTION_DAYS
+    if not days:
+        return
+    ttl = int(timedelta(days=days).total_seconds())
+    for name in ("batches", "candidates"):
+        try:
+            _archive(name).create_index("archived_at", expireAfterSeconds=ttl)
+        except OperationFailure as exc:
+            if exc.code != _INDEX_OPTIONS_CONFLICT:
+                raise
+            # Retention changed since the index was built – update it in place.
+            get_db().command("collMod", f"{name}_archive",
+                             index={"keyPattern": {"archived_at": 1}, "expireAfterSeconds": ttl})
+
+
+# ── Archival ──────────────────────────────────────────────────────────────────
+
+def resolve_destination(destination: Optional[str] = None) -> str:
+    """
+    The archive destination to use (default ARCHIVE_DESTINATION).
+    Raises ValueError for file archives while PII_RETENTION_DAYS is set.
+    """
+    settings    = get_settings()
+    destination = destination or settings.ARCHIVE_DESTINATION
+    if destination == FILE and settings.PII_RETENTION_DAYS:
+        raise ValueError("File archives cannot be purged of PII; archive to a collection "
+                         "or unset PII_RETENTION_DAYS.")
+    return destination
+
+
+def _write_archive(kind: str, docs: List[dict], destination: str, batch_id: str) -> None:
+    """Store docs in the archive. Safe to repeat after a partial failure."""
+    now = datetime.utcnow()
+    for doc in docs:
+        doc["archived_at"] = now
+
+    if destination == FILE:
+        # One file per chunk, named by its first _id and written via rename:
+        # a retried chunk replaces its file instead of appending duplicates.
+        directory = get_settings().ARCHIVE_DIR
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{batch_id}.{kind}.{docs[0]['_id']}.ndjson.gz")
+        with gzip.open(path + ".tmp", "wt", encoding="utf-8") as fh:
+            fh.writelines(json_util.dumps(doc) + "\n" for doc in docs)
+        os.replace(path + ".tmp", path)
+        return
+
+    try:
+        _archive(kind).insert_many(docs, ordered=False)
+    except BulkWriteError as exc:
+        # Already archived by an interrupted earlier pass.
+        if any(err.get("code") != _DUPLICATE_KEY for err in exc.details.get("writeErrors", [])):
+            raise
+
+
+def _claimable(now: datetime) -> dict:
+    """Filter for batches no live pass is archiving (unclaimed or stale claim)."""
+    stale = now - timedelta(seconds=get_settings().ARCHIVE_CLAIM_TIMEOUT)
+    return {"$or": [{"archive_status": None}, {"archive_claimed_at": {"$not": {"$gte": stale}}}]}
+
+
+def archive_in_progress(batch: dict) -> bool:
+    """Whether a live (non-stale) archive pass holds the batch."""
+    if not batch.get("archive_status"):
+        return False
+    claimed_at = batch.get("archive_claimed_at")
+    timeout    = timedelta(seconds=get_settings().ARCHIVE_CLAIM_TIMEOUT)
+    return claimed_at is not None and claimed_at >= datetime.utcnow() - timeout
+
+
+def archive_batch(batch_id: str, destination: Optional[str] = None) -> int:
+    """
+    Move a deleted batch and its candidates into the archive.
+    Candidates go in ARCHIVE_CHUNK_SIZE chunks (write, then delete from the
+    hot collection), so a pass never holds the whole batch in memory.
+    The claim is refreshed after every chunk; one left behind by a crashed
+    pass goes stale after ARCHIVE_CLAIM_TIMEOUT seconds and is taken over.
+    On shutdown the pass stops between chunks and releases its claim; the
+    next pass picks up where it left off.
+    Returns the number of candidates archived; 0 if the batch is not deleted
+    or another pass already claimed it.
+    """
+    settings    = get_settings()
+    destination = resolve_destination(destination)
+    oid         = ObjectId(batch_id)
+
+    batch = _batches().find_one_and_update(
+        {"_id": oid, "deleted_at": {"$ne": None}, **_claimable(datetime.utcnow())},
+        {"$set": {"archive_status": "archiving", "archive_claimed_at": datetime.utcnow()}},
+    )
+    if not batch:
+        return 0
+
+    moved = 0
+    try:
+        while True:
+            if _stop.is_set():
+                _batches().update_one({"_id": oid}, {"$unset": {"archive_status": "", "archive_claimed_at": ""}})
+                logger.info("Archiving batch %s interrupted after %d candidate(s).", batch_id, moved)
+                return moved
+            chunk = list(
+                _candidates().find({"batch_id": batch_id}).sort("_id", 1).limit(settings.ARCHIVE_CHUNK_SIZE)
+            )
+            if not chunk:
+                break
+            ids = [doc["_id"] for doc in chunk]
+            _write_archive("candidates", chunk, destination, batch_id)
+            _candidates().delete_many({"_id": {"$in": ids}})
+            _batches().update_one({"_id": oid}, {"$set": {"archive_claimed_at": datetime.utcnow()}})
+            moved += len(chunk)
+
+        batch["archive_status"] = "archived"
+        batch.pop("archive_claimed_at", None)
+        _write_archive("batches", [batch], destination, batch_id)
+        _batches().delete_one({"_id": oid})
+    except Exception:
+        _batches().update_one({"_id": oid}, {"$unset": {"archive_status": "", "archive_claimed_at": ""}})
+        raise
+
+    logger.info("Archived batch %s with %d candidate(s) to %s.", batch_id, moved, destination)
+    return moved
+
+
+def archive_due_batches() -> List[str]:
+    """Archive batches deleted more than ARCHIVE_AFTER_DAYS ago."""
+    days = get_settings().ARCHIVE_AFTER_DAYS
+    if not days:
+        return []
+    resolve_destination()   # fail the whole pass early on a bad configuration
+    now    = datetime.utcnow()
+    cutoff = now - timedelta(days=days)
+    due    = _batches().find({"deleted_at": {"$lt": cutoff}, **_claimable(now)}, {"_id": 1})
+    ids    = [str(doc["_id"]) for doc in due]
+    for batch_id in ids:
+        if _stop.is_set():
+            break
+        archive_batch(batch_id)
+    return ids
+
+
+# ── Retention ─────────────────────────────────────────────────────────────────
+
+def purge_expired_pii() -> int:
+    """Unset PII_FIELDS on candidates older than PII_RETENTION_DAYS. Returns the count."""
+    settings = get_settings()
+    if not settings.PII_RETENTION_DAYS:
+        return 0
+    cutoff = datetime.utcnow() - timedelta(days=settings.PII_RETENTION_DAYS)
+    unset  = {f"data.{name}": "" for name in PII_FIELDS}
+
+    purged = 0
+    for col in (_candidates(), _archive("candidates")):
+        while not _stop.is_set():
+            ids = [
+                doc["_id"] for doc in
+                col.find({"pii_purged_at": None, "created_at": {"$lt": cutoff}}, {"_id": 1})
+                   .limit(settings.ARCHIVE_CHUNK_SIZE)
+            ]
+            if not ids:
+                break
+            col.update_many(
+                {"_id": {"$in": ids}},
+                {"$unset": unset, "$set": {"pii_purged_at": datetime.utcnow()}},
+            )
+            purged += len(ids)
+    return purged
+
+
+def prune_archive_files() -> List[str]:
+    """Delete archive files older than ARCHIVE_RETENTION_DAYS (they cannot be edited in place)."""
+    settings = get_settings()
+    if not settings.ARCHIVE_RETENTION_DAYS or not os.path.isdir(settings.ARCHIVE_DIR):
+        return []
+    cutoff  = time.time() - timedelta(days=settings.ARCHIVE_RETENTION_DAYS).total_seconds()
+    removed = []
+    for name in os.listdir(settings.ARCHIVE_DIR):
+        path = os.path.join(settings.ARCHIVE_DIR, name)
+        if name.endswith(".ndjson.gz") and os.path.getmtime(path) < cutoff:
+            os.remove(path)
+            removed.append(name)
+    return removed
+
+
+def run_retention_pass() -> None:
+    """One archival + retention sweep; each step logs and survives its own failure."""
+    for step in (archive_due_batches, purge_expired_pii, prune_archive_files):
+        try:
+            step()
+        except Exception:
+            logger.exception("Retention step %s failed.", step.__name__)
+
+
+# ── Background worker ─────────────────────────────────────────────────────────
+
+def _run() -> None:
+    while not _stop.wait(get_settings().RETENTION_INTERVAL):
+        run_retention_pass()
+
+
+def start_retention_worker() -> None:
+    """Start the periodic retention sweep. Call on application startup."""
+    global _thread
+    if _thread and _thread.is_alive():
+        return
+    _stop.clear()
+    _thread = threading.Thread(target=_run, name="retention", daemon=True)
+    _thread.start()
+
+
+def stop_retention_worker() -> None:
+    """
+    Stop the sweep and wait for it, so an in-flight pass (which stops at its
+    next chunk) cannot reopen the Mongo pool after close_db(). Call on shutdown.
+    """
+    global _thread
+    _stop.set()
+    if _thread:
+        _thread.join()
+        _thread = None
@@ -0,0 +1,137 @@
+"""
+app/models/seats.py
+Intake seat accounting for batches.
+Each batch carries a `seats_taken` counter that only moves through
+conditional find_one_and_update calls, so it never exceeds `intake_size`
+however many requests race for the last seat. Candidates record their
+position in `seat_status`:
+
+    "seated"     – holds one of the batch's seats
+    "waitlisted" – queued; promoted by screening score when a seat frees up
+    "released"   – gave up a seat (e.g. rejected on review)
+"""
+from datetime import datetime
+from typing import List, Optional
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.client_session import ClientSession
+
+from app.db.mongo import get_db
+
+SEATED     = "seated"
+WAITLISTED = "waitlisted"
+RELEASED   = "released"
+
+# Promotion order – best screening score first, then first come first served.
+WAITLIST_SORT = [("screening_score", -1), ("created_at", 1)]
+
+
+def _batches():
+    return get_db()["batches"]
+
+
+def _candidates():
+    return get_db()["candidates"]
+
+
+def ensure_indexes() -> None:
+    """Create the waitlist index. Run once at startup (see app/db/warmup.py)."""
+    _candidates().create_index([("batch_id", 1), ("seat_status", 1)] + WAITLIST_SORT)
+
+
+def backfill_seats() -> int:
+    """
+    Give seats to candidates created before seat accounting existed (no
+    `seat_status`). Run once via scripts/backfill_seats.py; safe to repeat.
+    Per batch, oldest first: rejected candidates are released, the rest are
+    seated through reserve_seats while seats last and waitlisted after that,
+    so `seats_taken` always matches the seated count and never exceeds
+    `intake_size`. Returns the number of candidates backfilled.
+    """
+    _batches().update_many({"seats_taken": {"$exists": False}}, {"$set": {"seats_taken": 0}})
+
+    legacy = {"seat_status": {"$exists": False}, "deleted_at": None}
+    done   = 0
+    for batch_id in _candidates().distinct("batch_id", legacy):
+        docs = list(_candidates().find({**legacy, "batch_id": batch_id}, {"review_status": 1})
+                    .sort("created_at", 1))
+        rejected = [d["_id"] for d in docs if d.get("review_status") == "rejected"]
+        waiting  = [d["_id"] for d in docs if d.get("review_status") != "rejected"]
+        granted  = reserve_seats(batch_id, len(waiting)) if waiting and ObjectId.is_valid(batch_id) else 0
+
+        now = datetime.utcnow()
+        for status, ids in ((RELEASED, rejected), (SEATED, waiting[:granted]), (WAITLISTED, waiting[granted:])):
+            if ids:
+                result = _candidates().update_many(
+                    {"_id": {"$in": ids}, "seat_status": {"$exists": False}},
+                    {"$set": {"seat_status": status, "updated_at": now}},
+                )
+                done += result.modified_count
+                if status == SEATED and result.modified_count < len(ids):
+                    # Another instance backfilled some of these concurrently.
+                    release_seats(batch_id, len(ids) - result.modified_count)
+    return done
+
+
+def reserve_seats(batch_id: str, count: int = 1, session: Optional[ClientSession] = None) -> int:
+    """
+    Atomically take up to `count` seats in a batch.
+    Returns how many were granted (0 when the batch is full or unknown).
+    """
+    oid = ObjectId(batch_id)
+    while count > 0:
+        taken = {"$ifNull": ["$seats_taken", 0]}
+        doc = _batches().find_one_and_update(
+            {"_id": oid, "deleted_at": None,
+             "$expr": {"$lte": [{"$add": [taken, count]}, "$intake_size"]}},
+            {"$inc": {"seats_taken": count}},
+            projection={"_id": 1},
+            session=session,
+        )
+        if doc:
+            return count
+        # Not enough room for all of them – retry with whatever is left.
+        doc = _batches().find_one(
+            {"_id": oid, "deleted_at": None},
+            {"intake_size": 1, "seats_taken": 1},
+            session=session,
+        )
+        if not doc:
+            return 0
+        count = min(count, doc["intake_size"] - doc.get("seats_taken", 0))
+    return 0
+
+
+def release_seats(batch_id: str, count: int = 1, session: Optional[ClientSession] = None) -> None:
+    """Give `count` seats back to a batch (never dropping below zero)."""
+    if count <= 0:
+        return
+    _batches().update_one(
+        {"_id": ObjectId(batch_id), "seats_taken": {"$gte": count}},
+        {"$inc": {"seats_taken": -count}},
+        session=session,
+    )
+
+
+def promote_from_waitlist(batch_id: str) -> List[str]:
+    """
+    Fill free seats from the waitlist, best candidate first.
+    A seat is reserved before a candidate is claimed, so concurrent callers
+    can neither over-fill the batch nor promote the same candidate twice.
+    Returns the ids of promoted candidates.
+    """
+    promoted: List[str] = []
+    while reserve_seats(batch_id):
+        doc = _candidates().find_one_and_update(
+            {"batch_id": batch_id, "seat_status": WAITLISTED, "deleted_at": None},
+            {"$set": {"seat_status": SEATED, "updated_at": datetime.utcnow()}},
+            sort=WAITLIST_SORT,
+            projection={"_id": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+        if not doc:
+            release_seats(batch_id)
+            break
+        promoted.append(str(doc["_id"]))
+    return promoted
@@ -3,6 +3,7 @@ app/models/user.py
 Low-level user CRUD operations against MongoDB.
 All DB interaction lives here so routes stay thin.
 """
+import threading
 from datetime import datetime
 from typing import Optional
 
@@ -12,10 +13,26 @@ from pymongo.errors import DuplicateKeyError
 from app.db.mongo import get_db
 
 
+_email_index_lock  = threading.Lock()
+_email_index_ready = False
+
+
 def _users():
-    col = get_db()["users"]
-    col.create_index("email", unique=True)
-    return col
+    # create_user relies on the unique email index for duplicate detection,
+    # so make sure it exists before first use rather than trusting warm-up
+    # (requests and scripts can get here before it has run).
+    if not _email_index_ready:
+        ensure_indexes()
+    return get_db()["users"]
+
+
+def ensure_indexes() -> None:
+    """Create user indexes. Runs at startup (see app/db/warmup.py) or on first use."""
+    global _email_index_ready
+    with _email_index_lock:
+        if not _email_index_ready:
+            get_db()["users"].create_index("email", unique=True)
+            _email_index_ready = True
 
 
 def get_user_count() -> int:
@@ -0,0 +1,30 @@
+"""
+app/schemas/audit_schemas.py
+Pydantic schemas for audit log responses.
+"""
+from typing import Any, List, Optional
+from pydantic import BaseModel, Field
+
+
+class AuditChange(BaseModel):
+    field: str
+    old:   Any = None
+    new:   Any = None
+
+
+class AuditEventOut(BaseModel):
+    id:          str
+    action:      str
+    entity_type: str
+    entity_id:   str
+    batch_id:    str
+    actor:       Optional[str]     = None
+    changes:     List[AuditChange] = Field(default_factory=list)
+    created_at:  Optional[str]     = None
+
+
+class AuditPage(BaseModel):
+    items: List[AuditEventOut]
+    total: int
+    skip:  int
+    limit: int
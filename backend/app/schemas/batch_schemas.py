@@ -2,7 +2,7 @@
 app/schemas/batch_schemas.py
 Pydantic schemas for Batch request bodies and responses.
 """
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -20,5 +20,29 @@ class BatchOut(BaseModel):
     program:      str
     start_date:   str
     intake_size:  int
+    seats_taken:  int = 0
     created_by:   str
-    rules_config: Dict[str, Any]
\ No newline at end of file
+    rules_config: Dict[str, Any]
+
+
+class BatchSummaryOut(BaseModel):
+    id:               str
+    name:             str
+    program:          str
+    start_date:       str
+    intake_size:      int
+    seats_taken:      int  = 0
+    created_by:       str
+    has_custom_rules: bool = False
+    candidate_count:  int  = 0
+    flagged_count:    int  = 0
+    rules_config:     Optional[Dict[str, Any]] = None  # only with include_rules=true
+
+
+class BatchPage(BaseModel):
+    items:         List[BatchSummaryOut]
+    total:         int
+    total_intake:  int = 0   # across all matching batches, not just this page
+    program_count: int = 0
+    skip:          int
+    limit:         int
@@ -4,7 +4,7 @@ Pydantic schemas for Candidate request bodies and responses.
 The `data` field is intentionally open (Dict) to accommodate
 all form fields added in later phases without schema changes.
 """
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -32,10 +32,33 @@ class CandidateOut(BaseModel):
     review_status:      Optional[str]   = None
     reviewed_by:        Optional[str]   = None
     review_note:        Optional[str]   = None
+    seat_status:        Optional[str]   = None   # seated | waitlisted | released
     data:               Dict[str, Any]  = Field(default_factory=dict)
     created_at:         Optional[str]   = None
     updated_at:         Optional[str]   = None
 
 class ReviewRequest(BaseModel):
     review_status: str = Field(..., pattern="^(accepted|rejected)$")
-    review_note:   Optional[str] = None
\ No newline at end of file
+    review_note:   Optional[str] = None
+
+
+class TransferRequest(BaseModel):
+    source_batch_id: str
+    candidate_ids:   List[str] = Field(..., min_length=1, max_length=1000)
+
+
+class MergeRequest(BaseModel):
+    source_batch_id: str
+
+
+class TransferOutcome(BaseModel):
+    candidate_id: str
+    status:       str        # moved | not_found | ineligible | batch_full
+    errors:       List[str] = Field(default_factory=list)
+    notes:        List[str] = Field(default_factory=list)   # e.g. PII checks skipped
+
+
+class TransferResult(BaseModel):
+    target_batch_id: str
+    moved:           int
+    outcomes:        List[TransferOutcome]
@@ -0,0 +1,38 @@
+"""
+scripts/backfill_seats.py
+One-off migration for databases created before intake seat accounting
+(app/models/seats.py): gives every candidate without a `seat_status` a seat,
+a waitlist place or a released status, and sets `seats_taken` on batches.
+Safe to re-run – only candidates still lacking `seat_status` are touched.
+
+Usage: python scripts/backfill_seats.py [--db admitguard]
+"""
+import argparse
+import os
+import sys
+from typing import List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--db", help="database to migrate (default: DB_NAME from .env)")
+    args = parser.parse_args(argv)
+
+    # Settings are read on first use, so this redirects every model call.
+    if args.db:
+        os.environ["DB_NAME"] = args.db
+    sys.path.insert(0, BACKEND_DIR)
+    from app.db.mongo import close_db
+    from app.models.seats import backfill_seats
+
+    try:
+        print(f"Backfilled {backfill_seats()} candidate(s).")
+    finally:
+        close_db()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
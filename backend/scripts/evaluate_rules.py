@@ -0,0 +1,383 @@
+"""
+scripts/evaluate_rules.py
+Offline what-if evaluation of a rules_config over exported candidates.
+Streams a CSV, NDJSON or Parquet export in chunks and applies the same checks
+as app/core/eligibility.py as vectorised pandas column operations, then prints
+per-rule error / warning / exception counts and the resulting flag
+distribution. Never connects to MongoDB.
+
+Accepts exports with form fields either nested under `data` (mongoexport
+NDJSON, or CSV columns like `data.phone`) or as plain columns (`phone`).
+Recorded exceptions are read from `[data.]exceptions.<field>.checked/.reason`.
+
+Requires pandas and pyarrow (used to read every format):  pip install pandas pyarrow
+
+Usage: python scripts/evaluate_rules.py EXPORT [--config rules.json]
+                                        [--chunksize 200000] [--today 2026-07-01] [--json]
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import sys
+import time
+from datetime import date
+from typing import Any, Dict, Iterator, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+try:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - tooling dependency
+    sys.exit("evaluate_rules.py needs pandas and pyarrow: pip install pandas pyarrow")
+
+from app.core.eligibility import (
+    AADHAAR_RE, CHECKS, EMAIL_RE, FLAG_THRESHOLD, INDIAN_MOBILE_RE, PII_FIELDS,
+    RATIONALE_KEYWORDS, RATIONALE_MIN_LENGTH, TOP_LEVEL_FIELDS,
+)
+from app.models.batch import DEFAULT_RULES_CONFIG
+
+_RATIONALE_RE = "|".join(re.escape(kw) for kw in RATIONALE_KEYWORDS)
+_TRUE_STRINGS = {"true", "1", "yes"}
+_MAX_BUCKET   = max(5, FLAG_THRESHOLD + 1)   # exceptions-needed histogram: 0, 1, … , 5+
+_JSON_BLOCK_BYTES = 64 << 20
+
+
+# ── Reading ───────────────────────────────────────────────────────────────────
+
+def read_chunks(path: str, chunksize: int) -> Iterator["pd.DataFrame"]:
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        import pyarrow.csv as pa_csv
+        with open(path, encoding="utf-8", newline="") as fh:
+            header = next(csv.reader(fh))
+        # All columns as text keeps Aadhaar/phone digits intact; numbers are
+        # coerced per rule.
+        reader = pa_csv.open_csv(path, convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+        ))
+        yield from _rebatch(reader, chunksize)
+    elif ext in (".ndjson", ".jsonl", ".json"):
+        import pyarrow.json as pa_json
+        for block in _line_blocks(path, _JSON_BLOCK_BYTES):
+            try:
+                # Arrow parses the block in parallel; types are inferred per block.
+                table = pa_json.read_json(io.BytesIO(block))
+            except pa.ArrowInvalid:
+                # e.g. a field mixing strings and numbers – slower, but lenient.
+                yield _flatten_records(pd.read_json(io.BytesIO(block), lines=True, dtype=False))
+                continue
+            yield from _rebatch(table.to_batches(), chunksize)
+    elif ext == ".parquet":
+        import pyarrow.parquet as pq
+        yield from _rebatch(pq.ParquetFile(path).iter_batches(batch_size=chunksize), chunksize)
+    else:
+        sys.exit(f"Unsupported export format: {ext} (use .csv, .ndjson or .parquet)")
+
+
+def _line_blocks(path: str, size: int) -> Iterator[bytes]:
+    """Read ~size-byte blocks of whole lines."""
+    with open(path, "rb") as fh:
+        tail = b""
+        while True:
+            data = fh.read(size)
+            if not data:
+                break
+            data = tail + data
+            cut  = data.rfind(b"\n") + 1
+            if cut:
+                tail = data[cut:]
+                yield data[:cut]
+            else:
+                tail = data
+        if tail.strip():
+            yield tail
+
+
+def _rebatch(batches: Iterator[Any], chunksize: int) -> Iterator["pd.DataFrame"]:
+    """Group Arrow record batches into ~chunksize-row frames, structs flattened."""
+    def to_frame(pending):
+        table = pa.Table.from_batches(pending)
+        while any(pa.types.is_struct(f.type) for f in table.schema):
+            table = table.flatten()   # data.exceptions.x.reason, …
+        return table.to_pandas()
+
+    pending, rows = [], 0
+    for batch in batches:
+        pending.append(batch)
+        rows += batch.num_rows
+        if rows >= chunksize:
+            yield to_frame(pending)
+            pending, rows = [], 0
+    if pending:
+        yield to_frame(pending)
+
+
+def _flatten_records(df: "pd.DataFrame") -> "pd.DataFrame":
+    """Expand the nested `data` dicts of an NDJSON chunk into `data.<field>` columns."""
+    if "data" not in df.columns:
+        return df
+    nested = pd.DataFrame.from_records([d if isinstance(d, dict) else {} for d in df.pop("data")])
+    nested.index = df.index
+
+    exceptions: Dict[str, Dict[int, Any]] = {}
+    for row, excs in enumerate(nested.pop("exceptions") if "exceptions" in nested else ()):
+        if not isinstance(excs, dict):
+            continue
+        for name, exc in excs.items():
+            if isinstance(exc, dict):
+                exceptions.setdefault(f"exceptions.{name}.checked", {})[row] = exc.get("checked")
+                exceptions.setdefault(f"exceptions.{name}.reason", {})[row] = exc.get("reason")
+    for column, values in exceptions.items():
+        nested[column] = pd.Series(values, dtype=object).reindex(range(len(nested))).to_numpy()
+
+    nested.columns = [f"data.{c}" for c in nested.columns]
+    return pd.concat([df, nested], axis=1)
+
+
+# ── Column helpers ────────────────────────────────────────────────────────────
+
+def _text(df: "pd.DataFrame", column: str) -> "pd.Series":
+    if column not in df.columns:
+        return pd.Series(pd.NA, index=df.index, dtype="string")
+    return df[column].astype("string")
+
+
+def _blank(s: "pd.Series") -> "np.ndarray":
+    return (s.isna() | (s.str.strip() == "")).to_numpy(dtype=bool, na_value=True)
+
+
+def _column(df: "pd.DataFrame", name: str) -> "pd.Series":
+    """`data.<name>` for nested exports, `<name>` for flat ones."""
+    return _text(df, f"data.{name}" if f"data.{name}" in df.columns else name)
+
+
+def field(df: "pd.DataFrame", name: str) -> "pd.Series":
+    """Form field value, falling back to the top-level copy when blank."""
+    value = _column(df, name)
+    top   = TOP_LEVEL_FIELDS.get(name)
+    if top and top in df.columns:
+        value = value.where(~_blank(value), _text(df, top))
+    return value
+
+
+def _number(s: "pd.Series") -> "np.ndarray":
+    return pd.to_numeric(s, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+
+
+def numeric_field(df: "pd.DataFrame", name: str) -> "np.ndarray":
+    """Like field(), but parsed as floats (NaN when missing or not a number)."""
+    column = f"data.{name}" if f"data.{name}" in df.columns else name
+    value  = _number(df[column]) if column in df.columns else np.full(len(df), np.nan)
+    top    = TOP_LEVEL_FIELDS.get(name)
+    if top and top in df.columns:
+        value = np.where(np.isnan(value), _number(df[top]), value)
+    return value
+
+
+def _matches(s: "pd.Series", pattern: "re.Pattern") -> "np.ndarray":
+    return s.str.strip().str.match(pattern.pattern).to_numpy(dtype=bool, na_value=False)
+
+
+def _is_true(s: "pd.Series") -> "np.ndarray":
+    return s.str.strip().str.lower().isin(_TRUE_STRINGS).to_numpy(dtype=bool, na_value=False)
+
+
+def excused(df: "pd.DataFrame", name: str) -> "np.ndarray":
+    """Rows with a checked exception for `name` backed by a valid rationale."""
+    checked = _is_true(_column(df, f"exceptions.{name}.checked"))
+    reason  = _column(df, f"exceptions.{name}.reason").fillna("")
+    valid   = (reason.str.len() >= RATIONALE_MIN_LENGTH) & reason.str.lower().str.contains(_RATIONALE_RE)
+    return checked & valid.to_numpy(dtype=bool, na_value=False)
+
+
+# ── Vectorised rules (mirror app/core/eligibility.py) ─────────────────────────
+# Each returns (error_mask, warn_mask) as boolean arrays.
+
+def _full_name(df, rule, today):
+    s      = field(df, "full_name")
+    short  = (s.str.strip().str.len() < rule.get("min_length", 2)).to_numpy(dtype=bool, na_value=True)
+    digits = False
+    if rule.get("no_numbers", True):
+        digits = s.str.contains(r"\d").to_numpy(dtype=bool, na_value=False)
+    return _blank(s) | short | digits, None
+
+
+def _email(df, rule, today):
+    s = field(df, "email")
+    return _blank(s) | ~_matches(s, EMAIL_RE), None
+
+
+def _phone(df, rule, today):
+    s = field(df, "phone")
+    return _blank(s) | ~_matches(s, INDIAN_MOBILE_RE), None
+
+
+def _date_of_birth(df, rule, today):
+    dob   = pd.to_datetime(field(df, "date_of_birth").str.slice(0, 10), format="%Y-%m-%d", errors="coerce")
+    known = dob.notna().to_numpy()
+    age   = (today.year - dob.dt.year - ((dob.dt.month * 100 + dob.dt.day) > today.month * 100 + today.day))
+    age   = age.to_numpy(dtype=float, na_value=np.nan)
+    with np.errstate(invalid="ignore"):
+        out = (age < rule.get("min_age", 18)) | (age > rule.get("max_age", 35))
+    return None, known & out
+
+
+def _qualification(df, rule, today):
+    s       = field(df, "qualification")
+    allowed = rule.get("allowed")
+    bad     = ~s.isin(allowed).to_numpy(dtype=bool, na_value=False) if allowed else False
+    return _blank(s) | bad, None
+
+
+def _graduation_year(df, rule, today):
+    year = numeric_field(df, "graduation_year")
+    with np.errstate(invalid="ignore"):
+        return None, (year < rule.get("min", 2015)) | (year > rule.get("max", 2025))
+
+
+def _percentage_cgpa(df, rule, today):
+    num  = numeric_field(df, "percentage_cgpa")
+    mode = field(df, "score_mode").fillna("percent").to_numpy(dtype=object)
+    with np.errstate(invalid="ignore"):
+        low = np.where(mode == "percent", num < rule.get("min_percent", 60), num < rule.get("min_cgpa", 6.0))
+    return None, low
+
+
+def _screening_score(df, rule, today):
+    score = numeric_field(df, "screening_score")
+    with np.errstate(invalid="ignore"):
+        return None, score < rule.get("min", 40)
+
+
+def _interview_status(df, rule, today):
+    s       = field(df, "interview_status")
+    allowed = rule.get("allowed")
+    bad     = ~s.isin(allowed).to_numpy(dtype=bool, na_value=False) if allowed else False
+    return _blank(s) | (s == "Rejected").to_numpy(dtype=bool, na_value=False) | bad, None
+
+
+def _aadhaar(df, rule, today):
+    s = field(df, "aadhaar").str.replace(r"\.0$", "", regex=True)  # floats from numeric exports
+    return _blank(s) | ~_matches(s, AADHAAR_RE), None
+
+
+def _offer_letter(df, rule, today):
+    allowed = (rule.get("depends_on") or {}).get("interview_status", ["Cleared", "Waitlisted"])
+    status  = field(df, "interview_status")
+    return _is_true(field(df, "offer_letter_sent")) & ~status.isin(allowed).to_numpy(dtype=bool, na_value=False), None
+
+
+VECTOR_CHECKS = {
+    "full_name":        _full_name,
+    "email":            _email,
+    "phone":            _phone,
+    "date_of_birth":    _date_of_birth,
+    "qualification":    _qualification,
+    "graduation_year":  _graduation_year,
+    "percentage_cgpa":  _percentage_cgpa,
+    "screening_score":  _screening_score,
+    "interview_status": _interview_status,
+    "aadhaar":          _aadhaar,
+    "offer_letter":     _offer_letter,
+}
+
+
+# ── Evaluation ────────────────────────────────────────────────────────────────
+
+def evaluate(path: str, rules_config: Dict[str, Any], chunksize: int, today: date) -> Dict[str, Any]:
+    active = [k for k in VECTOR_CHECKS if rules_config.get(k)]
+    per_rule = {k: {"errors": 0, "warnings": 0, "excused": 0} for k in active}
+    needed_hist = np.zeros(_MAX_BUCKET + 1, dtype=np.int64)
+    rows = ineligible = 0
+
+    for df in read_chunks(path, chunksize):
+        n       = len(df)
+        blocked = np.zeros(n, dtype=bool)
+        needed  = np.zeros(n, dtype=np.int64)
+        # As on the server, PII checks are skipped once the PII was purged.
+        kept    = df["pii_purged_at"].isna().to_numpy() if "pii_purged_at" in df else None
+        for key in active:
+            err, warn = VECTOR_CHECKS[key](df, rules_config[key], today)
+            stats = per_rule[key]
+            if kept is not None and CHECKS[key][0] in PII_FIELDS:
+                err  = None if err is None else np.broadcast_to(err, n) & kept
+                warn = None if warn is None else warn & kept
+            if err is not None:
+                err = np.broadcast_to(err, n)
+                stats["errors"] += int(err.sum())
+                blocked |= err
+            if warn is not None:
+                ok_exc = excused(df, CHECKS[key][0])
+                stats["warnings"] += int(warn.sum())
+                stats["excused"]  += int((warn & ok_exc).sum())
+                needed  += warn
+                blocked |= warn & ~ok_exc
+        rows       += n
+        ineligible += int(blocked.sum())
+        needed_hist += np.bincount(np.minimum(needed, _MAX_BUCKET), minlength=_MAX_BUCKET + 1)
+
+    return {
+        "rows":       rows,
+        "ineligible": ineligible,
+        # The form flags a candidate with more than two exceptions.
+        "flagged":    int(needed_hist[FLAG_THRESHOLD + 1:].sum()),
+        "rules":      per_rule,
+        "exceptions_needed": {
+            (f"{i}+" if i == _MAX_BUCKET else str(i)): int(c) for i, c in enumerate(needed_hist)
+        },
+    }
+
+
+def _pct(part: int, whole: int) -> str:
+    return f"{100 * part / whole:5.1f}%" if whole else "    –"
+
+
+def print_report(summary: Dict[str, Any], rules_config: Dict[str, Any], elapsed: float) -> None:
+    rows = summary["rows"]
+    print(f"Evaluated {rows:,} candidates in {elapsed:.2f}s\n")
+    print(f"{'Rule':<24} {'Type':<7} {'Errors':>10} {'Warnings':>10} {'Excused':>10} {'Unexcused':>10}")
+    for key, stats in summary["rules"].items():
+        rule = rules_config[key]
+        unexcused = stats["warnings"] - stats["excused"]
+        print(f"{rule.get('label', key):<24} {rule.get('type', ''):<7} "
+              f"{stats['errors']:>10,} {stats['warnings']:>10,} {stats['excused']:>10,} {unexcused:>10,}")
+
+    print("\nExceptions needed per candidate:")
+    for bucket, count in summary["exceptions_needed"].items():
+        print(f"  {bucket:>3}: {count:>10,}  {_pct(count, rows)}")
+    print(f"\nFlagged (> {FLAG_THRESHOLD} exceptions): {summary['flagged']:,}  {_pct(summary['flagged'], rows)}")
+    print(f"Ineligible as recorded:   {summary['ineligible']:,}  {_pct(summary['ineligible'], rows)}")
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("export",      help="candidate export (.csv, .ndjson or .parquet)")
+    parser.add_argument("--config",    help="rules_config JSON file (default: DEFAULT_RULES_CONFIG)")
+    parser.add_argument("--chunksize", type=int, default=200_000)
+    parser.add_argument("--today",     type=date.fromisoformat, default=date.today(),
+                        help="reference date for age checks (YYYY-MM-DD)")
+    parser.add_argument("--json",      action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    rules_config = DEFAULT_RULES_CONFIG
+    if args.config:
+        with open(args.config, encoding="utf-8") as fh:
+            rules_config = json.load(fh)
+
+    started = time.perf_counter()
+    summary = evaluate(args.export, rules_config, args.chunksize, args.today)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_report(summary, rules_config, time.perf_counter() - started)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
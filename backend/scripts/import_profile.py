@@ -0,0 +1,73 @@
+"""
+scripts/import_profile.py
+Cold-start import profile for the API.
+Imports app.main in fresh interpreters with `-X importtime`, prints the
+slowest modules of the fastest run and fails (exit 1) when the total is over
+budget or when a backend that must stay lazy was imported eagerly.
+
+Usage: python scripts/import_profile.py [--budget-ms 1000] [--runs 5] [--top 15]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded on first use by app.core.security – must not appear at import time.
+# (cryptography is not listed: pymongo's TLS support imports it eagerly.)
+LAZY_MODULES = ("jose", "passlib", "bcrypt")
+
+
+def profile_once(target: str) -> Tuple[int, Dict[str, Tuple[int, int]]]:
+    """Return (total µs, {module: (self µs, cumulative µs)}) for one import."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    modules: Dict[str, Tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules[target][1], modules
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--target",    default="app.main")
+    parser.add_argument("--budget-ms", type=float, default=1000.0)
+    parser.add_argument("--runs",      type=int,   default=5)
+    parser.add_argument("--top",       type=int,   default=15)
+    args = parser.parse_args(argv)
+
+    total_us, modules = min(
+        (profile_once(args.target) for _ in range(args.runs)),
+        key=lambda run: run[0],
+    )
+
+    print(f"Slowest modules importing {args.target} (best of {args.runs} runs):")
+    print(f"  {'self ms':>9} {'cumul ms':>9}  module")
+    slowest = sorted(modules.items(), key=lambda kv: kv[1][0], reverse=True)
+    for name, (self_us, cumulative_us) in slowest[:args.top]:
+        print(f"  {self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}  {name}")
+
+    failures = []
+    total_ms = total_us / 1000
+    print(f"\nTotal: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    if total_ms > args.budget_ms:
+        failures.append(f"import time {total_ms:.1f} ms exceeds budget of {args.budget_ms:.0f} ms")
+
+    eager = sorted(m for m in modules if m.split(".")[0] in LAZY_MODULES)
+    if eager:
+        failures.append("lazy backends imported eagerly: " + ", ".join(eager))
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,128 @@
+"""
+scripts/seat_stress.py
+Concurrency stress check for intake seat accounting (app/models/seats.py).
+Runs against a real MongoDB in a throwaway database, which is dropped at the end:
+
+    1. many threads add candidates to one batch at once
+       → exactly intake_size are seated, the rest waitlisted,
+         and seats_taken matches the number of seated candidates
+    2. many threads release seats at once
+       → every freed seat goes to the best-scored waitlisted candidates
+    3. on a full batch with an empty waitlist, threads add candidates while
+       others release seats
+       → no seat is left free while anyone is waitlisted
+
+Usage: python scripts/seat_stress.py --db admitguard_stress [--workers 32]
+                                     [--candidates 500] [--intake 100] [--release 40]
+"""
+import argparse
+import os
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--db",         required=True, help="scratch database (dropped afterwards)")
+    parser.add_argument("--workers",    type=int, default=32)
+    parser.add_argument("--candidates", type=int, default=500)
+    parser.add_argument("--intake",     type=int, default=100)
+    parser.add_argument("--release",    type=int, default=40)
+    args = parser.parse_args(argv)
+    if args.db == "admitguard":
+        parser.error("refusing to run against the application database")
+
+    # Settings are read on first use, so this redirects every model call.
+    os.environ["DB_NAME"] = args.db
+    sys.path.insert(0, BACKEND_DIR)
+    from app.db.mongo import close_db, get_db
+    from app.db.warmup import warm_up
+    from app.models.batch import create_batch, get_batch_by_id
+    from app.models.candidate import create_candidate, get_candidate_by_id, release_seat
+    from app.models.seats import SEATED, WAITLISTED
+
+    failures: List[str] = []
+
+    def check(ok: bool, msg: str) -> None:
+        print(f"  {'ok  ' if ok else 'FAIL'} {msg}")
+        if not ok:
+            failures.append(msg)
+
+    def counts(batch_id: str):
+        col = get_db()["candidates"]
+        return (
+            col.count_documents({"batch_id": batch_id, "seat_status": SEATED}),
+            col.count_documents({"batch_id": batch_id, "seat_status": WAITLISTED}),
+            get_batch_by_id(batch_id)["seats_taken"],
+        )
+
+    try:
+        warm_up()
+        batch = create_batch("stress", "stress", "2026-01-01", args.intake, created_by="seat_stress")
+        bid   = batch["id"]
+
+        print(f"Adding {args.candidates} candidates with {args.workers} workers "
+              f"(intake {args.intake})…")
+        scores = [round(random.uniform(0, 100), 2) for _ in range(args.candidates)]
+        with ThreadPoolExecutor(args.workers) as pool:
+            added = list(pool.map(
+                lambda i: create_candidate(bid, f"c{i}", f"c{i}@example.com", {}, screening_score=scores[i]),
+                range(args.candidates),
+            ))
+
+        seated, waitlisted, taken = counts(bid)
+        expected = min(args.intake, args.candidates)
+        check(seated == expected, f"{seated} seated, expected {expected}")
+        check(waitlisted == args.candidates - expected, f"{waitlisted} waitlisted")
+        check(taken == seated, f"seats_taken={taken} matches seated count")
+
+        waiting = sorted(
+            (c for c in added if c["seat_status"] == WAITLISTED),
+            key=lambda c: (-c["screening_score"], c["created_at"]),
+        )
+        to_release = [c for c in added if c["seat_status"] == SEATED][:args.release]
+        print(f"Releasing {len(to_release)} seats concurrently…")
+        with ThreadPoolExecutor(args.workers) as pool:
+            list(pool.map(release_seat, to_release))
+
+        seated, waitlisted, taken = counts(bid)
+        promoted = {c["id"] for c in waiting[:len(to_release)]}
+        check(seated == expected, f"{seated} seated after release, expected {expected}")
+        check(taken == seated, f"seats_taken={taken} matches seated count")
+        check(
+            all(get_candidate_by_id(cid)["seat_status"] == SEATED for cid in promoted),
+            f"the {len(promoted)} best-scored waitlisted candidates were promoted",
+        )
+
+        mixed = create_batch("stress-mixed", "stress", "2026-01-01", args.intake, created_by="seat_stress")
+        mid   = mixed["id"]
+        full  = [create_candidate(mid, f"m{i}", f"m{i}@example.com", {}) for i in range(args.intake)]
+        jobs  = [lambda c=c: release_seat(c) for c in full[:args.release]]
+        jobs += [
+            lambda i=i: create_candidate(mid, f"n{i}", f"n{i}@example.com", {}, screening_score=scores[i % len(scores)])
+            for i in range(2 * args.release)
+        ]
+        random.shuffle(jobs)
+        print(f"Adding {2 * args.release} candidates while releasing {args.release} seats…")
+        with ThreadPoolExecutor(args.workers) as pool:
+            list(pool.map(lambda job: job(), jobs))
+
+        seated, waitlisted, taken = counts(mid)
+        check(seated == args.intake, f"{seated} seated, expected {args.intake}")
+        check(taken == seated, f"seats_taken={taken} matches seated count")
+        check(not (waitlisted and taken < args.intake),
+              f"no free seat while {waitlisted} candidate(s) wait")
+    finally:
+        get_db().client.drop_database(args.db)
+        close_db()
+
+    print("FAILED" if failures else "PASSED")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))